@@ -0,0 +1,229 @@
+"""
+benchmarks/engine_benchmarks.py
+Micro-benchmarks for engine hot paths
+
+Run from the repository root. Timings are machine-specific, so record a
+baseline on your machine first (e.g. before a change), then compare:
+    python -m benchmarks.engine_benchmarks --output baseline.json
+    python -m benchmarks.engine_benchmarks --baseline baseline.json
+"""
+import argparse
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+import pygame
+from src.config.settings import *
+from src.core.headless import create_headless_game
+from src.entities.projectiles import ProjectileManager
+from src.managers.map_manager import MapManager
+
+SEED = 1234
+HORDE_SIZE = 300
+PROJECTILE_COUNT = 1000
+WAVE_SIZE = 10
+DT = FIXED_TIMESTEP
+
+
+def summarize(times):
+    """Get stats in milliseconds from a list of sample durations in seconds"""
+    ordered = sorted(times)
+
+    def percentile(p):
+        # Nearest-rank percentile
+        index = max(0, min(len(ordered) - 1, int(round(p / 100 * len(ordered) + 0.5)) - 1))
+        return ordered[index] * 1000
+
+    return {
+        'samples': len(ordered),
+        'mean': sum(ordered) / len(ordered) * 1000,
+        'min': ordered[0] * 1000,
+        'p50': percentile(50),
+        'p95': percentile(95),
+        'p99': percentile(99),
+        'max': ordered[-1] * 1000
+    }
+
+
+def measure(func, samples, inner=1, setup=None):
+    """Time func; each sample is the mean of `inner` calls, setup() runs untimed before each sample"""
+    times = []
+    for _ in range(samples):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(inner):
+            func()
+        times.append((time.perf_counter() - start) / inner)
+    return summarize(times)
+
+
+class Scenarios:
+    """Fixed, seeded scenarios shared by the benchmarks"""
+
+    def __init__(self):
+        self.rng = random.Random(SEED)
+        self.game = create_headless_game(seed=SEED)
+        self.screen = self.game.screen
+
+        # Fully generated exploration map with the player on the platform
+        self.game.current_map = self.game.map_manager.load_map(MAP_EXPLORATION)
+        self.game.state_manager.set_state(STATE_EXPLORATION)
+        self.map = self.game.current_map
+        self.player = self.game.player
+        self.player.rect.topleft = (100 * TILE_SIZE, 28 * TILE_SIZE)
+
+        # Night, so the day/night overlay and night spawns are active
+        day_night = self.game.day_night_manager
+        day_night.time = day_night.cycle_duration * 0.9
+
+        self.world_width = self.map.width * TILE_SIZE
+        self.world_height = self.map.height * TILE_SIZE
+
+    def spawn_horde(self):
+        """Spawn HORDE_SIZE enemies in the open air above the platform"""
+        self.map.clear_enemies()
+        enemy_types = ['goblin', 'skeleton', 'orc']
+        for _ in range(HORDE_SIZE):
+            x = self.rng.randrange(2, self.map.width - 2)
+            y = self.rng.randrange(20, 28)
+            self.map.spawn_enemy(x, y, self.rng.choice(enemy_types))
+
+    def create_projectiles(self):
+        """Create PROJECTILE_COUNT arrows flying across the open air"""
+        manager = ProjectileManager()
+        for _ in range(PROJECTILE_COUNT):
+            x = self.rng.randrange(0, self.world_width)
+            y = self.rng.randrange(5 * TILE_SIZE, 28 * TILE_SIZE)
+            target_x = x + self.rng.randrange(-400, 400)
+            target_y = y + self.rng.randrange(-200, 200)
+            manager.create_arrow(x, y, target_x, target_y, 10)
+        return manager
+
+    def random_rects(self, count, size=(TILE_SIZE, TILE_SIZE * 2)):
+        """Random entity-sized rects anywhere in the world"""
+        return [pygame.Rect(self.rng.randrange(0, self.world_width - size[0]),
+                            self.rng.randrange(0, self.world_height - size[1]), *size)
+                for _ in range(count)]
+
+    def random_points(self, count):
+        """Random world points"""
+        return [(self.rng.randrange(0, self.world_width), self.rng.randrange(0, self.world_height))
+                for _ in range(count)]
+
+
+def run_benchmarks(samples):
+    """Run every benchmark, returns {name: stats}"""
+    scenarios = Scenarios()
+    game_map = scenarios.map
+    results = {}
+
+    rects = scenarios.random_rects(1000)
+    results['map.get_colliding_blocks'] = measure(
+        lambda: [game_map.get_colliding_blocks(rect) for rect in rects], samples)
+    results['map.get_colliding_blocks']['calls_per_sample'] = len(rects)
+
+    points = scenarios.random_points(1000)
+    results['map.get_block_at'] = measure(
+        lambda: [game_map.get_block_at(x, y) for x, y in points], samples)
+    results['map.get_block_at']['calls_per_sample'] = len(points)
+
+    camera_iter = itertools.cycle(scenarios.random_points(samples))
+    results['map.render'] = measure(
+        lambda: game_map.render(scenarios.screen, *next(camera_iter), scenarios.game.day_night_manager), samples)
+
+    ui_manager = scenarios.game.ui_manager
+    results['ui_manager.render'] = measure(
+        lambda: ui_manager.render(scenarios.screen, scenarios.player, scenarios.game.day_night_manager, 3), samples)
+
+    scenarios.spawn_horde()
+    results['map.update_enemies.horde'] = measure(
+        lambda: game_map.update_enemies(DT, scenarios.player), samples)
+    results['map.update_enemies.horde']['enemies'] = HORDE_SIZE
+    game_map.clear_enemies()
+
+    holder = {}
+    results['projectile_manager.update'] = measure(
+        lambda: holder['manager'].update(DT, game_map), samples,
+        setup=lambda: holder.update(manager=scenarios.create_projectiles()))
+    results['projectile_manager.update']['projectiles'] = PROJECTILE_COUNT
+
+    # Daytime goblin waves around the player's spawn point on a fresh exploration map
+    asset_manager = scenarios.game.asset_manager
+    spawn_map = MapManager(asset_manager).load_map(MAP_EXPLORATION)
+    spawn_manager = scenarios.game.enemy_spawn_manager
+    spawn_y = 33 * TILE_SIZE
+    results['enemy_spawn_manager.spawn_wave'] = measure(
+        lambda: spawn_manager.spawn_wave('goblin', WAVE_SIZE, spawn_map, (100, spawn_y), spawn_y,
+                                         ignore_max_count=True),
+        samples, setup=spawn_map.clear_enemies)
+    # Timing a wave that found no ground would be meaningless
+    if not spawn_map.get_enemy_count('goblin'):
+        raise RuntimeError('No goblins spawned on a fresh exploration map')
+    results['enemy_spawn_manager.spawn_wave']['enemies'] = spawn_map.get_enemy_count('goblin')
+
+    results['map_generation.exploration'] = measure(
+        lambda: MapManager(asset_manager).load_map(MAP_EXPLORATION), max(3, samples // 10))
+
+    results['game.step.exploration'] = measure(lambda: scenarios.game.step(DT), samples)
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print p50 ratios against a baseline; returns names that regressed past threshold"""
+    regressions = []
+    for name, stats in sorted(results.items()):
+        base = baseline.get(name)
+        if not base:
+            print(f"{name:34s} {stats['p50']:9.3f} ms  (no baseline)")
+            continue
+        ratio = stats['p50'] / base['p50'] if base['p50'] else float('inf')
+        flag = ''
+        if ratio > threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f"{name:34s} {stats['p50']:9.3f} ms  baseline {base['p50']:9.3f} ms  x{ratio:.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Engine hot path benchmarks')
+    parser.add_argument('--samples', type=int, default=50, help='Samples per benchmark')
+    parser.add_argument('--output', help='Write results JSON to this path')
+    parser.add_argument('--baseline', help='Compare against a results JSON written earlier')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='p50 ratio above which a benchmark counts as a regression')
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.samples)
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'samples': args.samples,
+            'seed': SEED
+        },
+        'results': results
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            sys.exit(1)
+    elif not args.output:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
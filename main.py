@@ -1,13 +1,28 @@
 """
 Wild Eldoria - Main Entry Point
 """
+import argparse
 import pygame
 import sys
+import time
 from src.core.game import Game
+from src.core.replay import InputRecorder, Recording, replay
 from src.config.settings import *
 
 def main():
     """Initialize and run the game"""
+    parser = argparse.ArgumentParser(description='Wild Eldoria')
+    parser.add_argument('--record', metavar='PATH', help='Record input to a replay file')
+    parser.add_argument('--replay', metavar='PATH', help='Replay a recorded session at full speed')
+    parser.add_argument('--headless', action='store_true', help='Replay without a window')
+    parser.add_argument('--render', action='store_true', help='Render every tick while replaying')
+    args = parser.parse_args()
+    
+    if args.replay:
+        run_replay(args.replay, args.headless, args.render)
+        return
+    
+    start_time = time.perf_counter()
     pygame.init()
     
     # Create game window with resizable flag
@@ -16,16 +31,21 @@ def main():
     
     # Initialize game
     game = Game(screen)
+    recorder = InputRecorder(game) if args.record else None
     
     # Main game loop
     clock = pygame.time.Clock()
     running = True
     fullscreen = False
+    first_frame = True
+    accumulator = 0.0
     
     while running:
-        dt = clock.tick(FPS) / 1000.0  # Delta time in seconds
+        frame_time = clock.tick(FPS) / 1000.0  # Real time since last frame in seconds
+        accumulator += frame_time
         
         # Handle events
+        input_mark = game.profiler.begin()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
@@ -46,16 +66,55 @@ def main():
             
             # Handle game events
             game.handle_event(event)
+        game.profiler.end('input', input_mark)
         
-        # Update game state
-        game.update(dt)
+        # Update game state in fixed steps
+        steps = 0
+        while accumulator >= FIXED_TIMESTEP and steps < MAX_STEPS_PER_FRAME:
+            game.update(FIXED_TIMESTEP)
+            accumulator -= FIXED_TIMESTEP
+            steps += 1
+        if steps == MAX_STEPS_PER_FRAME:
+            # Too far behind - drop the backlog instead of trying to catch up
+            accumulator = min(accumulator, FIXED_TIMESTEP)
         
-        # Render
-        game.render(screen)
-        pygame.display.flip()
+        # Render, interpolating between the last two steps
+        game.render(screen, accumulator / FIXED_TIMESTEP)
+        game.present(screen)
+        
+        if first_frame:
+            first_frame = False
+            if PRINT_STARTUP_TIMINGS:
+                print_startup_timings(game.asset_manager.startup_timings, time.perf_counter() - start_time)
+    
+    if recorder:
+        recorder.stop().save(args.record)
+        print(f"Recorded {game.tick} ticks to {args.record}")
     
     pygame.quit()
     sys.exit()
 
+def run_replay(path, headless, render):
+    """Replay a recorded session and report the slowest ticks"""
+    recording = Recording.load(path)
+    start = time.perf_counter()
+    game, tick_times = replay(recording, headless=headless, render=render)
+    elapsed = time.perf_counter() - start
+    
+    print(f"Replayed {len(tick_times)} ticks in {elapsed:.2f} s (seed {recording.seed})")
+    slowest = sorted(range(len(tick_times)), key=lambda tick: tick_times[tick], reverse=True)[:5]
+    for tick in slowest:
+        print(f"  tick {tick}: {tick_times[tick] * 1000:.2f} ms")
+    pygame.quit()
+
+def print_startup_timings(timings, first_frame_time):
+    """Print asset loading breakdown and time to first frame"""
+    print(f"Time to first frame: {first_frame_time * 1000:.1f} ms")
+    print(f"  Assets total: {timings.get('total', 0) * 1000:.1f} ms")
+    for key in ('decode_wall', 'decode_total', 'convert', 'placeholders', 'atlas'):
+        print(f"    {key}: {timings.get(key, 0) * 1000:.1f} ms")
+    for name, seconds in sorted(timings.get('per_file', {}).items()):
+        print(f"      {name}: {seconds * 1000:.1f} ms")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
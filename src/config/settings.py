@@ -9,6 +9,24 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 
+# Simulation runs at a fixed rate; rendering interpolates between steps
+FIXED_TIMESTEP = 1.0 / 60
+MAX_STEPS_PER_FRAME = 5  # Slow frames drop time instead of spiralling
+
+# Presentation: update only changed regions on static screens
+PRESENT_DIRTY_RECTS = True
+DIRTY_RECT_MAX_COVERAGE = 0.5  # Above this fraction of the screen, flip instead
+
+# Baked static layers of the main map
+STATIC_LAYER_DARKNESS_BUCKETS = 16  # Day/night darkness steps between full day and full night
+STATIC_LAYER_CACHE_SIZE = 4  # Baked background/ground layers kept (keyed by size, darkness, camera_y)
+
+# Debug profiler overlay (toggle with F3)
+PROFILER_HISTORY = 120  # Frames of rolling timings
+
+# Master seed for the random streams (None = new seed every game)
+RNG_SEED = None
+
 # Grid and tile settings
 TILE_SIZE = 32
 GRID_WIDTH = 40
@@ -32,6 +50,20 @@ ATTACK_COOLDOWN = 0.5  # seconds
 ENEMY_ATTACK_DAMAGE = 5
 ENEMY_ATTACK_COOLDOWN = 1.0
 
+# Enemy navigation
+FLOW_FIELD_RADIUS = 16  # tiles, covers the 500px aggro range of an enemy that was hit
+
+# Enemy spawn placement (tiles)
+SPAWN_MIN_DISTANCE = 14  # Roughly off screen
+SPAWN_MAX_DISTANCE = 32
+SPAWN_CHUNK_SIZE = 8  # Spawn cell index bucket size
+SPAWN_SAMPLE_ATTEMPTS = 8  # Picks per spawn before giving up
+
+# Underground lighting (exploration map)
+LIGHT_MAX_LEVEL = 15  # Sky light level, drops by one per tile
+LIGHT_MAX_ALPHA = 200  # Darkness overlay alpha of an unlit tile
+LIGHT_TEXTURE_SNAP = 8  # tiles, scrolling rescales the light texture only across this grid
+
 # Inventory settings
 VISIBLE_SLOTS = 6
 HIDDEN_SLOTS = 6
@@ -85,6 +117,18 @@ SPRITES_PATH = ASSETS_PATH + "sprites/"
 SOUNDS_PATH = ASSETS_PATH + "sounds/"
 FONTS_PATH = ASSETS_PATH + "fonts/"
 
+# Texture atlas (small sprites are packed into shared pages at load time)
+ATLAS_PAGE_SIZE = 1024  # Maximum page size; pages start small and grow as sprites are packed
+ATLAS_MIN_PAGE_SIZE = 64
+ATLAS_MAX_SPRITE_SIZE = 256  # Larger sprites (backgrounds, building art) stay standalone
+
+# Asset loading
+ASSET_LOADER_THREADS = 4  # Worker threads decoding PNGs at startup
+PRINT_STARTUP_TIMINGS = False  # Print asset load breakdown and time to first frame
+ASSET_CACHE_ENABLED = True  # Keep decoded, pre-scaled sprites on disk for warm starts
+ASSET_CACHE_PATH = ".cache/assets/"
+ASSET_MEMORY_BUDGET = 64 * 1024 * 1024  # Bytes of decoded/scaled sprites and sounds kept resident
+
 # Map types
 MAP_MAIN = "main"
 MAP_EXPLORATION = "exploration"
@@ -0,0 +1,44 @@
+"""
+src/core/events.py
+Gameplay event bus (publish/subscribe instead of polling state every frame)
+"""
+from collections import namedtuple
+from src.config.settings import *
+
+# Event types (payloads are immutable tuples)
+BlockDestroyed = namedtuple('BlockDestroyed', 'game_map block')
+EnemyKilled = namedtuple('EnemyKilled', 'game_map enemy')
+ItemAdded = namedtuple('ItemAdded', 'inventory item_type count')
+GoldChanged = namedtuple('GoldChanged', 'player amount gold')  # amount is negative when spent
+DayChanged = namedtuple('DayChanged', 'day_count')
+MapChanged = namedtuple('MapChanged', 'map_type game_map')
+
+
+class EventBus:
+    """
+    Dispatches events to handlers subscribed to their type.
+    Publishing an event nobody listens to is a single dict lookup.
+    """
+
+    def __init__(self):
+        self.handlers = {}  # event type -> [handler, ...]
+
+    def subscribe(self, event_type, handler):
+        """Call handler(event) for every published event of event_type"""
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type, handler):
+        """Stop calling a handler"""
+        handlers = self.handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self.handlers[event_type]
+
+    def publish(self, event):
+        """Deliver an event to its subscribers, in subscription order"""
+        handlers = self.handlers.get(type(event))
+        if handlers:
+            # Copy, so handlers may unsubscribe while being called
+            for handler in tuple(handlers):
+                handler(event)
@@ -12,23 +12,47 @@ from src.managers.quest_manager import QuestManager
 from src.managers.day_night_manager import DayNightManager
 from src.managers.asset_manager import AssetManager
 from src.managers.enemy_spawn_manager import EnemySpawnManager
+from src.core.input import KeyboardInput
+from src.core.rng import RandomService
+from src.core.events import EventBus, DayChanged, MapChanged
+from src.core.profiler import FrameProfiler
+from src.core.presenter import DirtyRectPresenter
+from src.ui.profiler_overlay import ProfilerOverlay
 
 class Game:
-    def __init__(self, screen):
+    def __init__(self, screen, input_source=None, seed=RNG_SEED):
         self.screen = screen
         self.running = True
         
+        # Seeded random streams (world, spawn, loot, combat) for reproducible runs
+        self.rng = RandomService(seed)
+        
+        # Gameplay events (blocks destroyed, kills, items, gold, days, map changes)
+        self.events = EventBus()
+        
+        # Input comes from the keyboard, or from a script when running headless
+        self.input_source = input_source or KeyboardInput()
+        self.tick = 0  # Fixed steps simulated so far
+        self.recorder = None  # InputRecorder while a session is being recorded
+        
+        # Per-subsystem frame timings, overlay toggled with F3
+        self.profiler = FrameProfiler()
+        self.profiler_overlay = None
+        
+        # Presents only changed regions while the scene is static
+        self.presenter = DirtyRectPresenter()
+        
         # Initialize managers
         self.asset_manager = AssetManager()
         self.state_manager = StateManager(STATE_TUTORIAL)
-        self.map_manager = MapManager(self.asset_manager)
-        self.day_night_manager = DayNightManager()
+        self.map_manager = MapManager(self.asset_manager, self.events)
+        self.day_night_manager = DayNightManager(self.events)
         self.quest_manager = QuestManager()
         # Pass screen dimensions to UI manager
         screen_width, screen_height = screen.get_size()
         # Check if in fullscreen mode (pygame doesn't have direct check, so we'll pass False initially)
         self.ui_manager = UIManager(self.map_manager, screen_width, screen_height, is_fullscreen=False)
-        self.enemy_spawn_manager = EnemySpawnManager()
+        self.enemy_spawn_manager = EnemySpawnManager(self.rng)
         
         # Load initial map first
         self.current_map = self.map_manager.load_map(MAP_MAIN)
@@ -38,7 +62,7 @@ class Game:
         # Start player at center of map
         start_x = (self.current_map.width * TILE_SIZE) // 2
         start_y = 24 * TILE_SIZE
-        self.player = Player(start_x, start_y, self.asset_manager)
+        self.player = Player(start_x, start_y, self.asset_manager, self.input_source, self.rng, self.events)
         
         # Track player spawn position for depth calculation
         self.player_spawn_y = start_y
@@ -46,21 +70,35 @@ class Game:
         # Initialize enemy spawn configurations
         self._setup_enemy_spawns()
         
+        # Reset the exploration map when a reset day starts
+        self.events.subscribe(DayChanged, self.on_day_changed)
+        
         # Start with tutorial (as per readme)
         # Player starts with club weapon until tutorial is complete
         
         # Camera offset
         self.camera_x = 0
         self.camera_y = 0
+        self.previous_camera = (0, 0)  # Before the last fixed step (render interpolation)
     
     def update_screen_size(self, width, height, is_fullscreen=False):
         """Update screen size for UI and other components"""
         self.ui_manager.update_screen_size(width, height, is_fullscreen)
+        self.asset_manager.overlays.resize(width, height)
+        self.presenter.invalidate()
     
     def handle_event(self, event):
         """Handle pygame events"""
         current_state = self.state_manager.get_state()
         
+        if self.recorder:
+            self.recorder.record_event(event)
+        
+        # Input may change anything on screen (menus, states, inventory), so present a full frame
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                          pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.presenter.invalidate()
+        
         # Handle mouse clicks
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
@@ -71,6 +109,11 @@ class Game:
                         return  # Menu handled the click, don't process other buttons
                 
         
+        # Toggle profiler overlay
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.profiler.toggle()
+            return
+        
         # Handle ESC key based on context
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             # Close active menu if one is open
@@ -164,16 +207,15 @@ class Game:
                 self.ui_manager.open_building_menu(building.building_type, self.player)
     
     def update(self, dt):
-        """Update game state"""
+        """Update game state (called with a fixed dt, see FIXED_TIMESTEP)"""
         current_state = self.state_manager.get_state()
         
+        if current_state in [STATE_MAIN_MAP, STATE_EXPLORATION]:
+            self.store_previous_positions()
+        
         # Update day/night cycle (only in exploration)
         if current_state == STATE_EXPLORATION:
             self.day_night_manager.update(dt)
-            
-            # Check for map reset every 7 days
-            if self.day_night_manager.should_reset_map():
-                self.current_map.reset_exploration()
         
         # Update tutorial quest
         if current_state == STATE_TUTORIAL:
@@ -184,23 +226,33 @@ class Game:
         elif current_state in [STATE_MAIN_MAP, STATE_EXPLORATION]:
             # Block player movement if menu is open
             if not self.ui_manager.active_menu:
+                profiler = self.profiler
+                mark = profiler.begin()
                 self.player.update(dt, self.current_map)
+                profiler.end('player', mark)
                 
                 # Update enemies
+                mark = profiler.begin()
                 self.current_map.update_enemies(dt, self.player)
+                profiler.end('enemies', mark)
                 
                 # Update enemy spawn system (only in exploration)
                 if current_state == STATE_EXPLORATION:
+                    mark = profiler.begin()
                     self.enemy_spawn_manager.update(
                         dt, 
                         self.current_map, 
                         self.day_night_manager,
                         self.player_spawn_y,
-                        self.player.rect.centery
+                        self.player.rect.centery,
+                        self.player.rect.centerx
                     )
+                    profiler.end('spawns', mark)
                 
                 # Update camera
+                mark = profiler.begin()
                 self.update_camera()
+                profiler.end('camera', mark)
                 
                 # Check for map transitions
                 self.check_map_transitions()
@@ -212,9 +264,26 @@ class Game:
                 self.player.velocity_y += GRAVITY * dt
                 self.player.velocity_y = min(self.player.velocity_y, 1000)
                 # Apply vertical movement for gravity
-                self.player.rect.y += self.player.velocity_y * dt
                 self.player.on_ground = False
-                self.player.handle_collision(self.current_map, 'y')
+                self.player.move_and_collide(self.current_map, 'y', self.player.velocity_y * dt)
+        
+        self.tick += 1
+    
+    def step(self, dt=FIXED_TIMESTEP, ticks=1, render=False):
+        """
+        Advance the simulation by a number of fixed ticks as fast as possible
+        (headless runs, benchmarks). Input events are polled from the input source.
+        """
+        for _ in range(ticks):
+            if not self.running:
+                break
+            mark = self.profiler.begin()
+            for event in self.input_source.poll(self.tick):
+                self.handle_event(event)
+            self.profiler.end('input', mark)
+            self.update(dt)
+        if render and self.screen is not None:
+            self.render(self.screen)
     
     def _setup_enemy_spawns(self):
         """Setup enemy spawn configurations"""
@@ -246,6 +315,23 @@ class Game:
             max_count=1
         )
     
+    def store_previous_positions(self):
+        """Remember player, enemy and camera positions before a fixed step"""
+        self.player.previous_position = self.player.rect.topleft
+        for enemy in self.current_map.enemies:
+            enemy.previous_position = enemy.rect.topleft
+        self.previous_camera = (self.camera_x, self.camera_y)
+    
+    def get_render_camera(self, entity, camera_x, camera_y, alpha):
+        """
+        Get camera offset that draws entity at its interpolated position.
+        Interpolated = previous + (current - previous) * alpha, so shifting the
+        camera by (current - previous) * (1 - alpha) lets render() use rect as is.
+        """
+        previous_x, previous_y = entity.previous_position
+        return (camera_x + round((entity.rect.x - previous_x) * (1 - alpha)),
+                camera_y + round((entity.rect.y - previous_y) * (1 - alpha)))
+    
     def get_depth_level(self):
         """Calculate current depth level (blocks below spawn)"""
         depth = max(0, int((self.player.rect.y - self.player_spawn_y) / TILE_SIZE))
@@ -276,6 +362,11 @@ class Game:
             self.camera_x = max(0, min(self.camera_x, max_x))
             self.camera_y = max(0, min(self.camera_y, max_y))
     
+    def on_day_changed(self, event):
+        """Reset the exploration map every EXPLORATION_RESET_DAYS days"""
+        if event.day_count % EXPLORATION_RESET_DAYS == 0:
+            self.current_map.reset_exploration()
+    
     def check_map_transitions(self):
         """Check if player is transitioning between maps"""
         exit_point = self.current_map.get_exit_at(self.player.rect.center)
@@ -293,6 +384,10 @@ class Game:
                 # Reset velocity to prevent issues
                 self.player.velocity_x = 0
                 self.player.velocity_y = 0
+                # Don't interpolate across the teleport
+                self.update_camera()
+                self.store_previous_positions()
+                self.events.publish(MapChanged(MAP_EXPLORATION, self.current_map))
             elif exit_point == "main":
                 self.current_map = self.map_manager.load_map(MAP_MAIN)
                 self.state_manager.set_state(STATE_MAIN_MAP)
@@ -306,9 +401,13 @@ class Game:
                 # Reset velocity to prevent issues
                 self.player.velocity_x = 0
                 self.player.velocity_y = 0
+                # Don't interpolate across the teleport
+                self.update_camera()
+                self.store_previous_positions()
+                self.events.publish(MapChanged(MAP_MAIN, self.current_map))
     
-    def render(self, screen):
-        """Render game"""
+    def render(self, screen, alpha=1.0):
+        """Render game, alpha = fraction of a fixed step to interpolate past the previous state"""
         screen.fill(BLACK)
         
         current_state = self.state_manager.get_state()
@@ -329,30 +428,80 @@ class Game:
             else:
                 overlay_alpha = 0
             
+            # Interpolated camera between the last two fixed steps
+            previous_x, previous_y = self.previous_camera
+            camera_x = round(previous_x + (self.camera_x - previous_x) * alpha)
+            camera_y = round(previous_y + (self.camera_y - previous_y) * alpha)
+            
+            profiler = self.profiler
+            
             # Render map background and blocks (with day/night cycle for background)
-            self.current_map.render(screen, self.camera_x, self.camera_y, self.day_night_manager)
+            mark = profiler.begin()
+            self.current_map.render(screen, camera_x, camera_y, self.day_night_manager)
             
             # Render buildings (before player, so player appears on top)
-            for building in self.current_map.buildings:
-                building.render(screen, self.camera_x, self.camera_y)
+            # Maps with baked static layers already drew them
+            if not self.current_map.bakes_static_layers:
+                for building in self.current_map.buildings:
+                    building.render(screen, camera_x, camera_y)
+            profiler.end('map_render', mark)
             
             # Render enemies (before player, so player appears on top)
+            mark = profiler.begin()
             for enemy in self.current_map.enemies:
-                enemy.render(screen, self.camera_x, self.camera_y)
+                enemy_camera_x, enemy_camera_y = self.get_render_camera(enemy, camera_x, camera_y, alpha)
+                enemy.render(screen, enemy_camera_x, enemy_camera_y)
+                # Room for the HP bar above the enemy
+                self.presenter.add(enemy.rect.move(-enemy_camera_x, -enemy_camera_y).inflate(16, 40))
             
             # Render player (on first plan - after buildings and enemies)
-            self.player.render(screen, self.camera_x, self.camera_y)
+            player_camera_x, player_camera_y = self.get_render_camera(self.player, camera_x, camera_y, alpha)
+            self.player.render(screen, player_camera_x, player_camera_y)
+            self.presenter.add(self.player.rect.move(-player_camera_x, -player_camera_y).inflate(8, 8))
+            profiler.end('entity_render', mark)
+            
+            # Darken underground tiles by their light level (over entities, so they fade too)
+            if self.current_map.light_map:
+                mark = profiler.begin()
+                self.current_map.light_map.render(screen, camera_x, camera_y)
+                profiler.end('lighting', mark)
             
             # Apply day/night overlay
             if overlay_alpha > 0:
-                overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                overlay.fill((0, 0, 50))
-                overlay.set_alpha(overlay_alpha)
+                mark = profiler.begin()
+                overlay = self.asset_manager.overlays.get_fill('night', screen.get_size(), (0, 0, 50), overlay_alpha)
                 screen.blit(overlay, (0, 0))
+                profiler.end('day_night', mark)
             
             # Render UI (always on top)
+            mark = profiler.begin()
             depth_level = self.get_depth_level() if current_state == STATE_EXPLORATION else 0
             self.ui_manager.render(screen, self.player, self.day_night_manager, depth_level)
+            profiler.end('ui_render', mark)
+            
+            # Anything static changing (scrolling, mining, darkness, UI values) needs a full flip
+            player = self.player
+            self.presenter.set_scene((
+                current_state, camera_x, camera_y, id(self.current_map), len(self.current_map.blocks),
+                self.ui_manager.active_menu, overlay_alpha, depth_level, screen.get_size(),
+                player.hp, player.max_hp, player.gold, player.weapon, player.weapon_damage,
+                player.inventory.version,
+                self.day_night_manager.get_day_count(), self.day_night_manager.is_day()
+            ))
+        else:
+            self.presenter.set_scene((current_state, screen.get_size()))
+        
+        # Profiler overlay on top of everything, then close the frame's timings
+        if self.profiler.enabled:
+            if self.profiler_overlay is None:
+                self.profiler_overlay = ProfilerOverlay()
+            self.profiler_overlay.render(screen, self.profiler)
+            self.presenter.invalidate()
+        self.profiler.end_frame()
+    
+    def present(self, screen):
+        """Show the rendered frame (only changed regions when the scene is static)"""
+        self.presenter.present(screen)
     
     def render_mining_radius(self, screen):
         """Render semi-transparent gray circle showing mining radius on exploration map"""
@@ -363,12 +512,12 @@ class Game:
         player_center_x = self.player.rect.centerx - self.camera_x
         player_center_y = self.player.rect.centery - self.camera_y
         
-        # Create a surface for the circle with alpha
-        radius_surface = pygame.Surface((mining_radius * 2, mining_radius * 2), pygame.SRCALPHA)
-        
-        # Draw semi-transparent gray circle (outline only)
+        # Semi-transparent gray circle (outline only), drawn once
         gray_color = (128, 128, 128, 100)  # Gray with alpha
-        pygame.draw.circle(radius_surface, gray_color, (mining_radius, mining_radius), mining_radius, 2)
+        diameter = int(mining_radius * 2)
+        radius_surface = self.asset_manager.overlays.get_shape(
+            'mining_radius', (diameter, diameter),
+            lambda surface: pygame.draw.circle(surface, gray_color, (mining_radius, mining_radius), mining_radius, 2))
         
         # Blit the circle surface to screen
         screen.blit(radius_surface, (player_center_x - mining_radius, player_center_y - mining_radius))
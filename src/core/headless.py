@@ -0,0 +1,20 @@
+"""
+src/core/headless.py
+Headless game setup (no window, scripted input) for benchmarks and bulk simulations
+"""
+import os
+import pygame
+from src.config.settings import *
+from src.core.input import ScriptedInput
+
+def create_headless_game(script=None, seed=RNG_SEED, input_source=None):
+    """Create a Game on the SDL dummy video driver, driven by a ScriptedInput (or the given input source)"""
+    # Must be set before the display is initialized
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    # Imported here so assets are loaded after the dummy display exists
+    from src.core.game import Game
+    return Game(screen, input_source=input_source or ScriptedInput(script), seed=seed)
@@ -0,0 +1,73 @@
+"""
+src/core/input.py
+Input sources: live keyboard polling or scripted input for headless runs
+"""
+import pygame
+from src.config.settings import *
+
+class KeyboardInput:
+    """Reads the real keyboard state and pygame event queue"""
+
+    def get_pressed(self):
+        """Get held key states, indexable by pygame key constant"""
+        return pygame.key.get_pressed()
+
+    def poll(self, tick):
+        """Get pending events for this tick"""
+        return pygame.event.get()
+
+
+class HeldKeys:
+    """Key state lookup over a set of held keys (same indexing as pygame.key.get_pressed())"""
+
+    def __init__(self, held):
+        self.held = held
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class ScriptedInput:
+    """
+    Feeds pre-recorded events instead of polling devices.
+    Script entries are (tick, event); key state follows the KEYDOWN/KEYUP events fed so far.
+    """
+
+    def __init__(self, script=None):
+        self.script = sorted(script or [], key=lambda entry: entry[0])
+        self.position = 0
+        self.held = set()
+
+    def add_event(self, tick, event):
+        """Schedule an event for a tick"""
+        self.script.append((tick, event))
+        self.script.sort(key=lambda entry: entry[0])
+
+    def press(self, tick, key):
+        """Schedule a key press"""
+        self.add_event(tick, pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    def release(self, tick, key):
+        """Schedule a key release"""
+        self.add_event(tick, pygame.event.Event(pygame.KEYUP, key=key))
+
+    def get_pressed(self):
+        """Get held key states, indexable by pygame key constant"""
+        return HeldKeys(self.held)
+
+    def poll(self, tick):
+        """Get scripted events due at or before this tick"""
+        events = []
+        while self.position < len(self.script) and self.script[self.position][0] <= tick:
+            event = self.script[self.position][1]
+            if event.type == pygame.KEYDOWN:
+                self.held.add(event.key)
+            elif event.type == pygame.KEYUP:
+                self.held.discard(event.key)
+            events.append(event)
+            self.position += 1
+        return events
+
+    def is_finished(self):
+        """Check if every scripted event was fed"""
+        return self.position >= len(self.script)
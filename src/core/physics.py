@@ -91,26 +91,98 @@ class PhysicsEngine:
         entity.velocity_y = dy * force * 0.5  # Less vertical knockback
     
     def raycast(self, start_pos, end_pos, blocks):
-        """Raycast from start to end, return first block hit"""
-        # Simple line-stepping raycast
-        steps = 50
-        dx = (end_pos[0] - start_pos[0]) / steps
-        dy = (end_pos[1] - start_pos[1]) / steps
-        
-        for i in range(steps):
-            check_x = start_pos[0] + dx * i
-            check_y = start_pos[1] + dy * i
-            
-            for block in blocks:
-                if block.rect.collidepoint(check_x, check_y):
-                    return block, (check_x, check_y)
+        """Raycast from start to end, return first block hit and the hit point"""
+        return self._traverse(start_pos, end_pos, self._tile_lookup(blocks))
+    
+    def raycast_many(self, segments, blocks):
+        """Raycast a batch of (start_pos, end_pos) pairs, sharing one tile lookup"""
+        lookup = self._tile_lookup(blocks)
         
-        return None, end_pos
+        # Rays toward a shared target (e.g. every enemy to the player) revisit the
+        # same tiles, so remember each tile's first block for the whole batch
+        tile_cache = {}
+        def cached_lookup(tile_x, tile_y):
+            tile = (tile_x, tile_y)
+            if tile not in tile_cache:
+                tile_cache[tile] = lookup(tile_x, tile_y)
+            return tile_cache[tile]
+        
+        return [self._traverse(start_pos, end_pos, cached_lookup) for start_pos, end_pos in segments]
     
     def is_line_of_sight(self, start_pos, end_pos, blocks):
         """Check if there's a clear line of sight between two points"""
         block, _ = self.raycast(start_pos, end_pos, blocks)
         return block is None
+    
+    def line_of_sight_many(self, segments, blocks):
+        """Check line of sight for a batch of (start_pos, end_pos) pairs"""
+        return [block is None for block, _ in self.raycast_many(segments, blocks)]
+    
+    def _tile_lookup(self, blocks):
+        """Get a (tile_x, tile_y) -> blocks function for a map or a plain block list"""
+        if hasattr(blocks, 'get_blocks_at_tile'):
+            return blocks.get_blocks_at_tile
+        
+        tile_index = {}
+        for block in blocks:
+            for tile_x in range(block.rect.left // TILE_SIZE, (block.rect.right - 1) // TILE_SIZE + 1):
+                for tile_y in range(block.rect.top // TILE_SIZE, (block.rect.bottom - 1) // TILE_SIZE + 1):
+                    tile_index.setdefault((tile_x, tile_y), []).append(block)
+        return lambda tile_x, tile_y: tile_index.get((tile_x, tile_y), [])
+    
+    def _traverse(self, start_pos, end_pos, lookup):
+        """Walk the tiles crossed by the segment (Amanatides-Woo) and stop at the first block"""
+        x0, y0 = start_pos
+        dx = end_pos[0] - x0
+        dy = end_pos[1] - y0
+        
+        tile_x = int(x0 // TILE_SIZE)
+        tile_y = int(y0 // TILE_SIZE)
+        
+        # Direction to step in and parametric distance (0..1) to the next tile border
+        if dx > 0:
+            step_x = 1
+            t_max_x = ((tile_x + 1) * TILE_SIZE - x0) / dx
+        elif dx < 0:
+            step_x = -1
+            t_max_x = (tile_x * TILE_SIZE - x0) / dx
+        else:
+            step_x = 0
+            t_max_x = float('inf')
+        t_delta_x = TILE_SIZE / abs(dx) if dx else float('inf')
+        
+        if dy > 0:
+            step_y = 1
+            t_max_y = ((tile_y + 1) * TILE_SIZE - y0) / dy
+        elif dy < 0:
+            step_y = -1
+            t_max_y = (tile_y * TILE_SIZE - y0) / dy
+        else:
+            step_y = 0
+            t_max_y = float('inf')
+        t_delta_y = TILE_SIZE / abs(dy) if dy else float('inf')
+        
+        t = 0.0
+        while True:
+            tile_blocks = lookup(tile_x, tile_y)
+            if tile_blocks:
+                return tile_blocks[0], (x0 + dx * t, y0 + dy * t)
+            
+            # Step into whichever neighbouring tile the ray reaches first
+            if t_max_x < t_max_y:
+                t = t_max_x
+                if t > 1:
+                    break
+                tile_x += step_x
+                t_max_x += t_delta_x
+            else:
+                t = t_max_y
+                if t > 1:
+                    break
+                tile_y += step_y
+                t_max_y += t_delta_y
+        
+        return None, end_pos
 
 
 class CollisionDetector:
@@ -161,21 +233,106 @@ class CollisionDetector:
     
     def sweep_test(self, rect, velocity, blocks):
         """Sweep test for continuous collision detection"""
-        # Move rect along velocity and check for collisions
-        test_rect = rect.copy()
-        steps = 10
-        step_x = velocity[0] / steps
-        step_y = velocity[1] / steps
-        
-        for i in range(steps):
-            test_rect.x += step_x
-            test_rect.y += step_y
-            
-            for block in blocks:
-                if test_rect.colliderect(block.rect):
-                    return block, i / steps  # Return block and collision time
+        time_of_impact, _, block = self.sweep_aabb(rect, velocity[0], velocity[1], blocks)
+        return block, time_of_impact
+    
+    def sweep_aabb(self, rect, dx, dy, blocks):
+        """
+        Analytic swept AABB test of rect moving by (dx, dy).
+        Returns (time_of_impact 0..1, hit normal, block); block is None if the path is clear.
+        Blocks the rect already overlaps at the start are ignored.
+        """
+        # Broad phase: only blocks overlapping the swept bounds
+        swept = rect.union(rect.move(dx, dy)).inflate(2, 2)
+        if hasattr(blocks, 'get_colliding_blocks'):
+            candidates = blocks.get_colliding_blocks(swept)
+        else:
+            candidates = self.get_colliding_blocks(swept, blocks)
+        
+        best_time = 1.0
+        best_normal = (0, 0)
+        best_block = None
+        for block in candidates:
+            hit = self._sweep_against(rect, dx, dy, block.rect)
+            if hit and hit[0] < best_time:
+                best_time, best_normal = hit
+                best_block = block
+        
+        return best_time, best_normal, best_block
+    
+    def _sweep_against(self, rect, dx, dy, target):
+        """Time of impact and normal of moving rect against a static rect, or None"""
+        # Entry/exit times along x
+        if dx > 0:
+            entry_x = (target.left - rect.right) / dx
+            exit_x = (target.right - rect.left) / dx
+        elif dx < 0:
+            entry_x = (target.right - rect.left) / dx
+            exit_x = (target.left - rect.right) / dx
+        elif rect.right <= target.left or rect.left >= target.right:
+            return None
+        else:
+            entry_x, exit_x = float('-inf'), float('inf')
         
-        return None, 1.0
+        # Entry/exit times along y
+        if dy > 0:
+            entry_y = (target.top - rect.bottom) / dy
+            exit_y = (target.bottom - rect.top) / dy
+        elif dy < 0:
+            entry_y = (target.bottom - rect.top) / dy
+            exit_y = (target.top - rect.bottom) / dy
+        elif rect.bottom <= target.top or rect.top >= target.bottom:
+            return None
+        else:
+            entry_y, exit_y = float('-inf'), float('inf')
+        
+        entry = max(entry_x, entry_y)
+        exit_time = min(exit_x, exit_y)
+        if entry > exit_time or entry < 0 or entry > 1:
+            return None
+        
+        if entry_x > entry_y:
+            normal = (-1 if dx > 0 else 1, 0)
+        else:
+            normal = (0, -1 if dy > 0 else 1)
+        return entry, normal
+
+
+def move_and_collide(entity, game_map, axis, distance):
+    """
+    Move an entity along one axis, stopping at the first block in the way
+    (swept, so fast moves can't tunnel). Shared by Entity and Player; the
+    entity's own handle_collision() then resolves any remaining overlap.
+    """
+    dx, dy = (distance, 0) if axis == 'x' else (0, distance)
+    _, _, block = game_map.sweep_rect(entity.rect, dx, dy)
+    
+    if block is None:
+        if axis == 'x':
+            entity.rect.x += distance
+        else:
+            entity.rect.y += distance
+    elif axis == 'x':
+        if distance > 0:  # Moving right
+            entity.rect.right = block.rect.left
+        else:  # Moving left
+            entity.rect.left = block.rect.right
+    else:
+        if distance > 0:  # Falling
+            entity.rect.bottom = block.rect.top
+        else:  # Jumping up
+            entity.rect.top = block.rect.bottom
+    
+    # Resolve any overlap the sweep ignores (e.g. spawned inside a block)
+    entity.handle_collision(game_map, axis)
+    
+    if block is not None:
+        if axis == 'x':
+            entity.velocity_x = 0
+        else:
+            if distance > 0:
+                entity.on_ground = True
+            entity.velocity_y = 0
 
 
 class MovementController:
@@ -0,0 +1,63 @@
+"""
+src/core/presenter.py
+Dirty-rectangle presentation (update only changed screen regions)
+"""
+import pygame
+from src.config.settings import *
+
+class DirtyRectPresenter:
+    """
+    Presents only the regions marked dirty this frame plus last frame's
+    (so whatever moved away is repainted too). Anything that changes the whole
+    scene (camera scroll, state change, resize, input) calls invalidate() and
+    the next frame falls back to a full flip.
+    """
+
+    def __init__(self, enabled=PRESENT_DIRTY_RECTS, max_coverage=DIRTY_RECT_MAX_COVERAGE):
+        self.enabled = enabled
+        self.max_coverage = max_coverage
+        self.full_redraw = True
+        self.dirty = []
+        self.previous_dirty = []
+        self.scene_key = None
+
+        # Stats for the last present() call
+        self.presented_pixels = 0
+        self.last_was_full = True
+
+    def invalidate(self):
+        """Force a full flip on the next present()"""
+        self.full_redraw = True
+
+    def set_scene(self, key):
+        """Full flip if the static part of the scene (camera, state, map, UI values...) changed"""
+        if key != self.scene_key:
+            self.scene_key = key
+            self.full_redraw = True
+
+    def add(self, rect):
+        """Mark a screen region as changed this frame"""
+        self.dirty.append(pygame.Rect(rect))
+
+    def present(self, screen):
+        """Push this frame to the display"""
+        width, height = screen.get_size()
+        rects = self.dirty + self.previous_dirty
+        screen_rect = screen.get_rect()
+        rects = [rect.clip(screen_rect) for rect in rects]
+        area = sum(rect.width * rect.height for rect in rects)
+
+        full = not self.enabled or self.full_redraw or area > width * height * self.max_coverage
+        if full:
+            pygame.display.flip()
+            self.presented_pixels = width * height
+        else:
+            rects = [rect for rect in rects if rect.width and rect.height]
+            if rects:
+                pygame.display.update(rects)
+            self.presented_pixels = area
+
+        self.last_was_full = full
+        self.previous_dirty = self.dirty
+        self.dirty = []
+        self.full_redraw = False
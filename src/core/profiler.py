@@ -0,0 +1,74 @@
+"""
+src/core/profiler.py
+Per-subsystem frame profiler (rolling timings for the debug overlay)
+"""
+import time
+from collections import deque
+from src.config.settings import *
+
+# Sections in display order
+PROFILER_SECTIONS = ['input', 'player', 'enemies', 'spawns', 'camera',
+                     'map_render', 'entity_render', 'lighting', 'day_night', 'ui_render']
+
+
+class FrameProfiler:
+    """
+    Accumulates time per section during a frame and keeps a rolling history.
+    While disabled, begin() returns 0 and end() returns immediately, so the
+    hooks left in the game loop cost one attribute check each.
+    """
+
+    def __init__(self, history=PROFILER_HISTORY):
+        self.enabled = False
+        self.history = history
+        self.current = {}  # section -> seconds spent this frame
+        self.samples = {section: deque(maxlen=history) for section in PROFILER_SECTIONS}
+        self.frame_times = deque(maxlen=history)  # ms per frame
+        self.last_frame_end = None
+
+    def toggle(self):
+        """Turn profiling on/off (history restarts when turned on)"""
+        self.enabled = not self.enabled
+        if self.enabled:
+            self.current = {}
+            for samples in self.samples.values():
+                samples.clear()
+            self.frame_times.clear()
+            self.last_frame_end = None
+
+    def begin(self):
+        """Start timing a section, returns a mark for end()"""
+        if not self.enabled:
+            return 0
+        return time.perf_counter()
+
+    def end(self, section, mark):
+        """Stop timing a section started with begin()"""
+        if not self.enabled or not mark:
+            return
+        self.current[section] = self.current.get(section, 0.0) + time.perf_counter() - mark
+
+    def end_frame(self):
+        """Push this frame's section times into the rolling history"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self.last_frame_end is not None:
+            self.frame_times.append((now - self.last_frame_end) * 1000)
+        self.last_frame_end = now
+
+        for section, samples in self.samples.items():
+            samples.append(self.current.get(section, 0.0) * 1000)
+        self.current = {}
+
+    def get_average(self, section):
+        """Get rolling average of a section in ms"""
+        samples = self.samples.get(section)
+        if not samples:
+            return 0.0
+        return sum(samples) / len(samples)
+
+    def get_peak(self, section):
+        """Get rolling maximum of a section in ms"""
+        samples = self.samples.get(section)
+        return max(samples) if samples else 0.0
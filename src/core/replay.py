@@ -0,0 +1,177 @@
+"""
+src/core/replay.py
+Input recording and deterministic replay of play sessions
+"""
+import gzip
+import json
+import time
+import pygame
+from src.config.settings import *
+from src.core.input import HeldKeys
+
+REPLAY_VERSION = 1
+
+# Keys the game polls as held state (Player.update); everything else arrives as events
+RECORDED_KEYS = (pygame.K_a, pygame.K_LEFT, pygame.K_d, pygame.K_RIGHT)
+
+
+def _encode_event(tick, event):
+    """Get [tick, type, attributes] for an event, keeping only plain attribute values"""
+    attributes = {}
+    for name, value in event.dict.items():
+        if isinstance(value, tuple):
+            value = list(value)
+        if value is None or isinstance(value, (bool, int, float, str)):
+            attributes[name] = value
+        elif isinstance(value, list) and all(isinstance(v, (int, float)) for v in value):
+            attributes[name] = value
+    return [tick, event.type, attributes]
+
+
+def _decode_event(entry):
+    """Rebuild (tick, event) from an encoded entry"""
+    tick, event_type, attributes = entry
+    attributes = {name: tuple(value) if isinstance(value, list) else value
+                  for name, value in attributes.items()}
+    return tick, pygame.event.Event(event_type, attributes)
+
+
+class Recording:
+    """
+    A recorded session: master RNG seed, screen size, tick-stamped events and
+    held-key changes. Key state is stored only when it changes, and the file is
+    gzipped JSON, so long sessions stay small.
+    """
+
+    def __init__(self, seed, screen_size, events=None, keys=None, ticks=0):
+        self.seed = seed
+        self.screen_size = tuple(screen_size)
+        self.events = events if events is not None else []  # [tick, type, attributes]
+        self.keys = keys if keys is not None else []  # [tick, [held keys]]
+        self.ticks = ticks
+
+    def save(self, path):
+        """Write the recording to a file"""
+        data = {
+            'version': REPLAY_VERSION,
+            'seed': self.seed,
+            'screen_size': list(self.screen_size),
+            'ticks': self.ticks,
+            'events': self.events,
+            'keys': self.keys
+        }
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        """Read a recording written by save()"""
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        return cls(data['seed'], data['screen_size'], data['events'], data['keys'], data['ticks'])
+
+
+class InputRecorder:
+    """
+    Records a session from the start of a game: every event fed to
+    Game.handle_event and the held key state Player.update polls, stamped with
+    the game tick. Installs itself as the game's input source.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.source = game.input_source
+        self.recording = Recording(game.rng.seed, game.screen.get_size())
+        self.held = []
+
+        game.input_source = self
+        game.player.input_source = self
+        game.recorder = self
+
+    def get_pressed(self):
+        """Get held key states from the real source, recording changes"""
+        pressed = self.source.get_pressed()
+        held = [key for key in RECORDED_KEYS if pressed[key]]
+        if held != self.held:
+            self.held = held
+            self.recording.keys.append([self.game.tick, held])
+        return pressed
+
+    def poll(self, tick):
+        """Get pending events from the real source"""
+        return self.source.poll(tick)
+
+    def record_event(self, event):
+        """Record an event about to be handled this tick"""
+        self.recording.events.append(_encode_event(self.game.tick, event))
+
+    def stop(self):
+        """Stop recording and restore the real input source, returns the Recording"""
+        self.recording.ticks = self.game.tick
+        self.game.input_source = self.source
+        self.game.player.input_source = self.source
+        self.game.recorder = None
+        return self.recording
+
+
+class ReplayInput:
+    """Feeds a Recording back: events and held keys at the ticks they were recorded"""
+
+    def __init__(self, recording):
+        self.events = [_decode_event(entry) for entry in recording.events]
+        self.keys = recording.keys
+        self.event_position = 0
+        self.key_position = 0
+        self.held = set()
+
+    def get_pressed(self):
+        """Get held key states, indexable by pygame key constant"""
+        return HeldKeys(self.held)
+
+    def poll(self, tick):
+        """Get recorded events for this tick and apply key changes made up to it"""
+        while self.key_position < len(self.keys) and self.keys[self.key_position][0] <= tick:
+            self.held = set(self.keys[self.key_position][1])
+            self.key_position += 1
+
+        events = []
+        while self.event_position < len(self.events) and self.events[self.event_position][0] <= tick:
+            events.append(self.events[self.event_position][1])
+            self.event_position += 1
+        return events
+
+    def is_finished(self):
+        """Check if every recorded event was fed"""
+        return self.event_position >= len(self.events)
+
+
+def replay(recording, headless=True, render=False):
+    """
+    Run a recording at full speed. Returns (game, tick_times) where tick_times
+    holds the seconds each tick took (update, plus render/present if render).
+    """
+    input_source = ReplayInput(recording)
+    if headless:
+        from src.core.headless import create_headless_game
+        game = create_headless_game(seed=recording.seed, input_source=input_source)
+    else:
+        pygame.init()
+        screen = pygame.display.set_mode(recording.screen_size)
+        pygame.display.set_caption("Wild Eldoria - Replay")
+        from src.core.game import Game
+        game = Game(screen, input_source=input_source, seed=recording.seed)
+    if game.screen.get_size() != recording.screen_size:
+        game.screen = pygame.display.set_mode(recording.screen_size)
+        game.update_screen_size(*recording.screen_size)
+
+    tick_times = []
+    while game.tick < recording.ticks and game.running:
+        start = time.perf_counter()
+        game.step()
+        if render:
+            game.render(game.screen)
+            game.present(game.screen)
+        tick_times.append(time.perf_counter() - start)
+    return game, tick_times
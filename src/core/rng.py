@@ -0,0 +1,52 @@
+"""
+src/core/rng.py
+Seeded random number streams shared by all subsystems
+"""
+import random
+from src.config.settings import *
+
+# Named streams (one per subsystem, so e.g. extra loot rolls don't shift spawns)
+RNG_STREAMS = ('world', 'spawn', 'loot', 'combat')
+
+
+class RandomService:
+    """
+    Independent random.Random streams derived from one master seed.
+    Stream seeds only depend on the master seed and the stream name, so a run
+    started from the same seed (and the same input) replays identically.
+    """
+
+    def __init__(self, seed=None):
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        """Restart every stream from a master seed (a new random seed if None)"""
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        self.streams = {}
+
+    def get(self, name):
+        """Get a named stream, created on first use"""
+        stream = self.streams.get(name)
+        if stream is None:
+            # String seeds are hashed with SHA-512, independent of PYTHONHASHSEED
+            stream = random.Random(f"{self.seed}:{name}")
+            self.streams[name] = stream
+        return stream
+
+    @property
+    def world(self):
+        return self.get('world')
+
+    @property
+    def spawn(self):
+        return self.get('spawn')
+
+    @property
+    def loot(self):
+        return self.get('loot')
+
+    @property
+    def combat(self):
+        return self.get('combat')
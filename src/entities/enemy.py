@@ -5,6 +5,7 @@ Enemy AI and behavior
 import pygame
 from src.config.settings import *
 from src.entities.entity import Entity
+from src.systems.pathfinding import FlowField
 
 class Enemy(Entity):
     def __init__(self, x, y, enemy_type, asset_manager, sprite_path=None):
@@ -27,6 +28,7 @@ class Enemy(Entity):
         
         # AI state
         self.state = 'idle'
+        self.can_see_player = True  # Refreshed by the map's batched line-of-sight check
         self.target = None
         self.attack_cooldown = 0
         self.aggro_range = 300
@@ -36,6 +38,12 @@ class Enemy(Entity):
         self.patrol_timer = 0
         self.patrol_direction = 1
         self.idle_timer = 0
+        
+        # Navigation (dungeon paths are planned once and followed tile by tile)
+        self.nav_path = []
+        self.nav_version = -1
+        self.nav_goal_region = None
+        self.nav_planned_cell = None
     
     def update(self, dt, player, game_map):
         """Update enemy AI and physics"""
@@ -52,31 +60,79 @@ class Enemy(Entity):
             # Attack player
             self.state = 'attacking'
             self.attack_player(player, dt)
-        elif distance < self.aggro_range:
-            # Chase player
+        elif distance < self.aggro_range and (self.state in ['chasing', 'attacking'] or self.can_see_player):
+            # Chase player (start only when player is visible, then keep chasing around walls)
             self.state = 'chasing'
-            self.chase_player(dx, dy, distance)
+            if not self.navigate(player, game_map):
+                self.chase_player(dx, dy, distance)
         else:
             # Patrol or idle
             self.state = 'patrol'
             self.patrol(dt)
         
         # Apply horizontal movement
-        self.rect.x += self.velocity_x * dt
-        self.handle_collision(game_map, 'x')
+        self.move_and_collide(game_map, 'x', self.velocity_x * dt)
         
         # Apply gravity
         self.apply_gravity(dt)
         
         # Apply vertical movement
-        self.rect.y += self.velocity_y * dt
         self.on_ground = False
-        self.handle_collision(game_map, 'y')
+        self.move_and_collide(game_map, 'y', self.velocity_y * dt)
         
         # Update cooldowns
         if self.attack_cooldown > 0:
             self.attack_cooldown -= dt
     
+    def is_in_aggro_range(self, player):
+        """Check if player is close enough to be noticed"""
+        dx = player.rect.centerx - self.rect.centerx
+        dy = player.rect.centery - self.rect.centery
+        return dx * dx + dy * dy < self.aggro_range * self.aggro_range
+    
+    def navigate(self, player, game_map):
+        """Steer along a dungeon path or the map flow field, returns False if neither applies"""
+        cell = FlowField.get_cell(self.rect)
+        
+        navigator = getattr(game_map, 'navigator', None)
+        if navigator:
+            step = self._next_path_step(navigator, cell, FlowField.get_cell(player.rect))
+            if step:
+                self.follow_step(cell, step)
+                return True
+            return False
+        
+        flow_field = getattr(game_map, 'flow_field', None)
+        if flow_field:
+            step = flow_field.get_direction(cell)
+            if step and step != (0, 0):
+                self.follow_step(cell, step)
+                return True
+        return False
+    
+    def _next_path_step(self, navigator, cell, player_cell):
+        """Get next step along cached dungeon path, replanning only when needed"""
+        goal_region = navigator.get_region(player_cell)
+        
+        # Drop waypoints we already reached
+        if cell in self.nav_path:
+            self.nav_path = self.nav_path[self.nav_path.index(cell) + 1:]
+        
+        # Replan if tiles changed, player moved to another region or we left/finished the path
+        off_path = self.nav_path and (abs(self.nav_path[0][0] - cell[0]) + abs(self.nav_path[0][1] - cell[1])) > 1
+        finished = not self.nav_path and cell != self.nav_planned_cell
+        if (off_path or finished or self.nav_version != navigator.version
+                or self.nav_goal_region != goal_region):
+            self.nav_path = navigator.find_path(cell, player_cell)
+            self.nav_version = navigator.version
+            self.nav_goal_region = goal_region
+            self.nav_planned_cell = cell
+        
+        if not self.nav_path:
+            return None
+        next_x, next_y = self.nav_path[0]
+        return (next_x - cell[0], next_y - cell[1])
+    
     def chase_player(self, dx, dy, distance):
         """Chase the player"""
         # Move toward player horizontally
@@ -94,6 +150,24 @@ class Enemy(Entity):
         if dy < -TILE_SIZE and abs(dx) < TILE_SIZE * 3 and self.on_ground:
             self.velocity_y = PLAYER_JUMP_VELOCITY * 0.8
     
+    def follow_step(self, cell, step):
+        """Move one tile along a path step (dx, dy) from the given cell"""
+        step_x, step_y = step
+        if step_x != 0:
+            self.velocity_x = self.speed if step_x > 0 else -self.speed
+            self.facing_right = step_x > 0
+        else:
+            # Vertical step - line up with the tile column so we fit through the gap
+            offset = (cell[0] * TILE_SIZE + TILE_SIZE // 2) - self.rect.centerx
+            if abs(offset) > 2:
+                self.velocity_x = self.speed if offset > 0 else -self.speed
+            else:
+                self.velocity_x = 0
+        
+        # Jump when the path goes up
+        if step_y < 0 and self.on_ground:
+            self.velocity_y = PLAYER_JUMP_VELOCITY * 0.8
+    
     def attack_player(self, player, dt):
         """Attack the player"""
         self.velocity_x = 0
@@ -120,6 +194,7 @@ class Enemy(Entity):
         super().take_damage(damage)
         # Become aggressive when hit
         self.aggro_range = 500
+        self.can_see_player = True
     
     def render(self, screen, camera_x, camera_y):
         """Render enemy"""
@@ -129,26 +204,29 @@ class Enemy(Entity):
         screen_x = self.rect.x - camera_x
         screen_y = self.rect.y - camera_y
         
-        # Try to load custom sprite if path provided
+        # Custom sprite if path provided (loaded once and shared by all enemies using it)
         sprite = None
-        if self.sprite_path:
-            try:
-                sprite = pygame.image.load(self.sprite_path).convert_alpha()
-                sprite = pygame.transform.scale(sprite, (self.rect.width, self.rect.height))
-            except:
-                sprite = None
+        if self.sprite_path and self.asset_manager:
+            sprite = self.asset_manager.load_scaled_sprite(self.sprite_path, self.rect.size)
         
         # If no custom sprite, try asset manager
         if not sprite:
             sprite = self.asset_manager.get_sprite(f'enemy_{self.enemy_type}') if self.asset_manager else None
         
         # Draw shadow
-        shadow_rect = pygame.Rect(screen_x + 2, screen_y + self.rect.height - 3, self.rect.width - 4, 3)
-        shadow_surface = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-        shadow_surface.fill((0, 0, 0, 120))
-        screen.blit(shadow_surface, shadow_rect)
+        if self.asset_manager:
+            shadow = self.asset_manager.get_shadow(self.rect.width - 4, 3, 120)
+            screen.blit(shadow, (screen_x + 2, screen_y + self.rect.height - 3))
+        
+        # Draw sprite if available, otherwise use baked color-based placeholder
+        if not sprite and self.asset_manager:
+            size = self.rect.size
+            facing_right = self.facing_right
+            sprite = self.asset_manager.get_variant(
+                ('enemy', self.enemy_type, size, facing_right),
+                lambda: self._bake_placeholder(size, facing_right)
+            )
         
-        # Draw sprite if available, otherwise use color-based placeholder
         if sprite:
             screen.blit(sprite, (screen_x, screen_y))
         else:
@@ -169,19 +247,42 @@ class Enemy(Entity):
         if self.state == 'attacking':
             pygame.draw.circle(screen, RED, (screen_x + self.rect.width // 2, screen_y - 5), 3)
     
+    def _bake_placeholder(self, size, facing_right):
+        """Draw color-based placeholder body with facing indicator onto a new surface"""
+        width, height = size
+        surface = pygame.Surface(size)
+        surface.fill(self._get_enemy_color())
+        eye_x = (width - 5) if facing_right else 5
+        pygame.draw.circle(surface, WHITE, (eye_x, 10), 3)
+        return surface
+    
     def _render_hp_bar(self, screen, screen_x, screen_y):
         """Render HP bar above enemy"""
         hp_bar_width = TILE_SIZE
         hp_bar_height = 4
         hp_percentage = self.hp / self.max_hp
         
-        # Background
-        pygame.draw.rect(screen, HP_BAR_BG, 
-                        (screen_x, screen_y - 10, hp_bar_width, hp_bar_height))
+        # Background (baked frame)
+        if self.asset_manager:
+            frame = self.asset_manager.get_variant(
+                ('hp_bar_frame', hp_bar_width, hp_bar_height),
+                lambda: self._bake_hp_bar_frame(hp_bar_width, hp_bar_height)
+            )
+            screen.blit(frame, (screen_x, screen_y - 10))
+        else:
+            pygame.draw.rect(screen, HP_BAR_BG,
+                            (screen_x, screen_y - 10, hp_bar_width, hp_bar_height))
         # HP
         pygame.draw.rect(screen, HP_BAR_COLOR,
                         (screen_x, screen_y - 10, int(hp_bar_width * hp_percentage), hp_bar_height))
     
+    @staticmethod
+    def _bake_hp_bar_frame(width, height):
+        """Create HP bar background surface"""
+        surface = pygame.Surface((width, height))
+        surface.fill(HP_BAR_BG)
+        return surface
+    
     def _get_enemy_color(self):
         """Get color based on enemy type"""
         colors = {
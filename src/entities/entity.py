@@ -4,12 +4,14 @@ Base entity class for all game entities
 """
 import pygame
 from src.config.settings import *
+from src.core.physics import move_and_collide
 
 class Entity:
     """Base class for all entities (player, enemies, etc.)"""
     
     def __init__(self, x, y, width, height):
         self.rect = pygame.Rect(x, y, width, height)
+        self.previous_position = self.rect.topleft  # Before the last fixed step (render interpolation)
         self.velocity_x = 0
         self.velocity_y = 0
         self.on_ground = False
@@ -38,6 +40,10 @@ class Entity:
         self.rect.x += self.velocity_x * dt
         self.rect.y += self.velocity_y * dt
     
+    def move_and_collide(self, game_map, axis, distance):
+        """Move along one axis, stopping at the first block in the way"""
+        move_and_collide(self, game_map, axis, distance)
+    
     def handle_collision(self, game_map, axis):
         """Handle collision with map blocks"""
         collided_blocks = game_map.get_colliding_blocks(self.rect)
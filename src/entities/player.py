@@ -6,11 +6,19 @@ import pygame
 from src.config.settings import *
 from src.systems.inventory import Inventory
 from src.systems.equipment import Equipment
+from src.core.input import KeyboardInput
+from src.core.physics import move_and_collide
+from src.core.rng import RandomService
+from src.core.events import EventBus, GoldChanged
 
 class Player:
-    def __init__(self, x, y, asset_manager):
+    def __init__(self, x, y, asset_manager, input_source=None, rng=None, events=None):
         self.rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
+        self.previous_position = self.rect.topleft  # Before the last fixed step (render interpolation)
         self.asset_manager = asset_manager
+        self.input_source = input_source or KeyboardInput()  # Held key state (scripted when headless)
+        self.rng = rng or RandomService()  # Loot rolls use the 'loot' stream
+        self.events = events or EventBus()
         
         # Physics
         self.velocity_x = 0
@@ -30,7 +38,7 @@ class Player:
         self.is_attacking = False
         
         # Systems
-        self.inventory = Inventory(TOTAL_SLOTS)
+        self.inventory = Inventory(TOTAL_SLOTS, self.events)
         self.equipment = Equipment()
         
         # Block interaction
@@ -74,7 +82,7 @@ class Player:
     def update(self, dt, current_map):
         """Update player state"""
         # Get current key states for continuous movement
-        keys = pygame.key.get_pressed()
+        keys = self.input_source.get_pressed()
         
         # Horizontal movement
         self.velocity_x = 0
@@ -86,8 +94,7 @@ class Player:
             self.facing_right = True
         
         # Apply horizontal movement
-        self.rect.x += self.velocity_x * dt
-        self.handle_collision(current_map, 'x')
+        self.move_and_collide(current_map, 'x', self.velocity_x * dt)
         
         # Jumping (only use event-based, not continuous key check)
         if self.keys['jump'] and self.on_ground:
@@ -100,9 +107,8 @@ class Player:
         self.velocity_y = min(self.velocity_y, 1000)  # Terminal velocity
         
         # Apply vertical movement
-        self.rect.y += self.velocity_y * dt
         self.on_ground = False
-        self.handle_collision(current_map, 'y')
+        self.move_and_collide(current_map, 'y', self.velocity_y * dt)
         
         # Update attack cooldown
         if self.attack_cooldown > 0:
@@ -120,6 +126,10 @@ class Player:
             if self.destroy_progress >= BLOCK_DESTROY_TIME:
                 self.finish_destroying_block(current_map)
     
+    def move_and_collide(self, current_map, axis, distance):
+        """Move along one axis, stopping at the first block in the way"""
+        move_and_collide(self, current_map, axis, distance)
+    
     def handle_collision(self, current_map, axis):
         """Handle collision with map blocks and screen boundaries"""
         # Check left screen boundary (prevent player from leaving left side)
@@ -173,12 +183,12 @@ class Player:
             )
         
         # Check for enemy hits
-        for enemy in current_map.enemies:
+        for enemy in current_map.enemies[:]:
             if attack_rect.colliderect(enemy.rect):
                 enemy.take_damage(self.weapon_damage)
                 if enemy.hp <= 0:
-                    self.gold += enemy.coin_value
-                    current_map.enemies.remove(enemy)
+                    self.add_gold(enemy.coin_value)
+                    current_map.despawn_enemy(enemy, killed=True)
         
         # Block destruction is handled separately via attack_block method with mouse targeting
     
@@ -209,10 +219,10 @@ class Player:
             damage = BLOCK_BASE_DAMAGE
             if block.take_damage(damage):
                 # Block destroyed
-                import random
                 # Random chance to get gold from blocks (10% chance)
-                if random.random() < 0.1:
-                    gold_amount = random.randint(1, 5)
+                loot = self.rng.loot
+                if loot.random() < 0.1:
+                    gold_amount = loot.randint(1, 5)
                     self.add_gold(gold_amount)
                 
                 # Add block to inventory and remove from map
@@ -237,9 +247,9 @@ class Player:
         """Complete block destruction and add to inventory"""
         if self.destroying_block:
             # Random chance to get gold from blocks (10% chance)
-            import random
-            if random.random() < 0.1:
-                gold_amount = random.randint(1, 5)
+            loot = self.rng.loot
+            if loot.random() < 0.1:
+                gold_amount = loot.randint(1, 5)
                 self.add_gold(gold_amount)
             
             # Add block to inventory
@@ -280,11 +290,13 @@ class Player:
     def add_gold(self, amount):
         """Add gold to player"""
         self.gold += amount
+        self.events.publish(GoldChanged(self, amount, self.gold))
     
     def spend_gold(self, amount):
         """Spend gold, return True if successful"""
         if self.gold >= amount:
             self.gold -= amount
+            self.events.publish(GoldChanged(self, -amount, self.gold))
             return True
         return False
     
@@ -295,13 +307,29 @@ class Player:
         screen_y = self.rect.y - camera_y
         
         # Draw shadow first
-        shadow_rect = pygame.Rect(screen_x + 2, screen_y + self.rect.height - 4, self.rect.width - 4, 4)
-        shadow_surface = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-        shadow_surface.fill((0, 0, 0, 100))
-        screen.blit(shadow_surface, shadow_rect)
+        shadow = self.asset_manager.get_shadow(self.rect.width - 4, 4, 100)
+        screen.blit(shadow, (screen_x + 2, screen_y + self.rect.height - 4))
+        
+        # Body is baked once per (size, facing, attacking) variant
+        size = self.rect.size
+        facing_right = self.facing_right
+        attacking = self.is_attacking
+        body = self.asset_manager.get_variant(
+            ('player', size, facing_right, attacking),
+            lambda: self._bake_body(size, facing_right, attacking)
+        )
+        screen.blit(body, (screen_x, screen_y))
+        
+        self.is_attacking = False
+    
+    @staticmethod
+    def _bake_body(size, facing_right, attacking):
+        """Draw player body, highlight, border and eyes onto a new surface"""
+        width, height = size
+        surface = pygame.Surface(size)
         
         # Draw player body with gradient effect
-        if self.is_attacking:
+        if attacking:
             # Attack color - bright orange/red
             base_color = (255, 100, 50)
             highlight_color = (255, 200, 100)
@@ -311,23 +339,23 @@ class Player:
             highlight_color = (135, 206, 250)  # Light sky blue
         
         # Main body
-        player_rect = pygame.Rect(screen_x, screen_y, self.rect.width, self.rect.height)
-        pygame.draw.rect(screen, base_color, player_rect)
+        player_rect = pygame.Rect(0, 0, width, height)
+        pygame.draw.rect(surface, base_color, player_rect)
         
         # Highlight on top
-        highlight_rect = pygame.Rect(screen_x, screen_y, self.rect.width, self.rect.height // 3)
-        pygame.draw.rect(screen, highlight_color, highlight_rect)
+        highlight_rect = pygame.Rect(0, 0, width, height // 3)
+        pygame.draw.rect(surface, highlight_color, highlight_rect)
         
         # Border
-        pygame.draw.rect(screen, (30, 30, 30), player_rect, 2)
+        pygame.draw.rect(surface, (30, 30, 30), player_rect, 2)
         
         # Draw eyes
-        eye_y = screen_y + self.rect.height // 3
-        if self.facing_right:
-            pygame.draw.circle(screen, WHITE, (screen_x + self.rect.width // 3, eye_y), 4)
-            pygame.draw.circle(screen, BLACK, (screen_x + self.rect.width // 3 + 1, eye_y), 2)
+        eye_y = height // 3
+        if facing_right:
+            pygame.draw.circle(surface, WHITE, (width // 3, eye_y), 4)
+            pygame.draw.circle(surface, BLACK, (width // 3 + 1, eye_y), 2)
         else:
-            pygame.draw.circle(screen, WHITE, (screen_x + 2 * self.rect.width // 3, eye_y), 4)
-            pygame.draw.circle(screen, BLACK, (screen_x + 2 * self.rect.width // 3 - 1, eye_y), 2)
+            pygame.draw.circle(surface, WHITE, (2 * width // 3, eye_y), 4)
+            pygame.draw.circle(surface, BLACK, (2 * width // 3 - 1, eye_y), 2)
         
-        self.is_attacking = False
\ No newline at end of file
+        return surface
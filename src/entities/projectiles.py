@@ -40,9 +40,14 @@ class Projectile:
         if self.gravity_affected:
             self.velocity_y += GRAVITY * dt * 0.3  # Reduced gravity
         
-        # Move
-        self.rect.x += self.velocity_x * dt
-        self.rect.y += self.velocity_y * dt
+        # Move (swept against the tile grid so fast projectiles can't pass through blocks)
+        dx = self.velocity_x * dt
+        dy = self.velocity_y * dt
+        time_of_impact, _, block = game_map.sweep_rect(self.rect, dx, dy)
+        self.rect.x += dx * time_of_impact
+        self.rect.y += dy * time_of_impact
+        if block:
+            self.active = False
         
         # Update angle for rotation
         if self.velocity_x != 0 or self.velocity_y != 0:
@@ -53,7 +58,7 @@ class Projectile:
         if self.lifetime <= 0:
             self.active = False
         
-        # Check collision with blocks
+        # Check collision with blocks (catches projectiles spawned inside a block)
         colliding_blocks = game_map.get_colliding_blocks(self.rect)
         if colliding_blocks:
             self.active = False
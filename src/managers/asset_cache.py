@@ -0,0 +1,127 @@
+"""
+src/managers/asset_cache.py
+On-disk cache of decoded, pre-scaled sprite pixels
+"""
+import pygame
+import os
+import json
+import mmap
+import hashlib
+from src.config.settings import *
+
+class AssetCache:
+    """
+    Stores decoded and scaled sprites as raw RGBA files so warm starts can skip
+    PNG decoding and scaling. Entries are keyed by the source file's content hash
+    plus the target size; the hash is only recomputed when the file's mtime or
+    size changes (tracked in index.json). Entries are read back through mmap.
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, cache_dir=ASSET_CACHE_PATH, enabled=ASSET_CACHE_ENABLED):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.index = {}  # source path -> {'mtime', 'size', 'hash', 'sizes': [[w, h], ...]}
+        if self.enabled:
+            self._load_index()
+
+    def _load_index(self):
+        """Load the source file index, starting empty if it's missing or unreadable"""
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE), 'r') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def _save_index(self):
+        """Write the source file index"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = os.path.join(self.cache_dir, self.INDEX_FILE + '.tmp')
+            with open(temp_path, 'w') as f:
+                json.dump(self.index, f)
+            os.replace(temp_path, os.path.join(self.cache_dir, self.INDEX_FILE))
+        except OSError:
+            pass
+
+    def _get_source_entry(self, path):
+        """Get index entry for a source file, rehashing it if mtime/size changed. None if missing."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        entry = self.index.get(path)
+        if entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry
+
+        with open(path, 'rb') as f:
+            content_hash = hashlib.sha1(f.read()).hexdigest()
+        # Keep the known sizes if only the mtime changed
+        sizes = entry['sizes'] if entry and entry['hash'] == content_hash else []
+        entry = {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'hash': content_hash, 'sizes': sizes}
+        self.index[path] = entry
+        self._save_index()
+        return entry
+
+    def _get_entry_path(self, entry, size):
+        """Get cache file path for a source hash and target size"""
+        return os.path.join(self.cache_dir, f"{entry['hash']}_{size[0]}x{size[1]}.rgba")
+
+    def is_warm(self, path):
+        """Check if every size previously requested for a source file is cached"""
+        if not self.enabled:
+            return False
+        entry = self.index.get(path)
+        if not entry or not entry['sizes']:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if entry['mtime'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            return False
+        return all(os.path.exists(self._get_entry_path(entry, size)) for size in entry['sizes'])
+
+    def load(self, path, size):
+        """Load cached sprite for source path at size, returns None on a miss"""
+        if not self.enabled:
+            return None
+        entry = self._get_source_entry(path)
+        if entry is None:
+            return None
+
+        entry_path = self._get_entry_path(entry, size)
+        try:
+            with open(entry_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size != size[0] * size[1] * 4:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    # frombuffer shares the mapped pixels; convert_alpha copies them out
+                    surface = pygame.image.frombuffer(buffer, size, 'RGBA').convert_alpha()
+        except (OSError, ValueError, pygame.error):
+            return None
+        return surface
+
+    def store(self, path, size, surface):
+        """Write sprite pixels for source path at size to the cache"""
+        if not self.enabled:
+            return
+        entry = self._get_source_entry(path)
+        if entry is None:
+            return
+
+        entry_path = self._get_entry_path(entry, size)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = entry_path + '.tmp'
+            with open(temp_path, 'wb') as f:
+                f.write(pygame.image.tobytes(surface, 'RGBA'))
+            os.replace(temp_path, entry_path)
+        except OSError:
+            return
+
+        if list(size) not in entry['sizes']:
+            entry['sizes'].append(list(size))
+            self._save_index()
@@ -4,24 +4,133 @@ Asset loading and caching
 """
 import pygame
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from src.config.settings import *
+from src.managers.texture_atlas import TextureAtlas
+from src.managers.asset_cache import AssetCache
+from src.managers.asset_residency import AssetResidency
+from src.managers.overlay_pool import OverlayPool
+
+
+def _decode_image(path):
+    """Decode image file without display conversion (runs on loader threads)"""
+    start = time.perf_counter()
+    try:
+        image = pygame.image.load(path)
+    except (pygame.error, OSError):
+        image = None
+    return image, time.perf_counter() - start
+
+
+class AssetLoadHandle:
+    """Future-like handle for sprites being decoded on a thread pool"""
+    
+    def __init__(self, asset_manager, entries, executor):
+        self.asset_manager = asset_manager
+        self.executor = executor
+        self.futures = [(name, path, executor.submit(_decode_image, path)) for name, path in entries]
+        self.start_time = time.perf_counter()
+        self.sprites = None
+        self.timings = {}
+    
+    def done(self):
+        """Check if all files finished decoding"""
+        return all(future.done() for _, _, future in self.futures)
+    
+    def result(self):
+        """Wait for decoding, convert to display format on this (main) thread and store sprites"""
+        if self.sprites is not None:
+            return self.sprites
+        
+        decoded = [(name, path, future.result()) for name, path, future in self.futures]
+        decode_wall = time.perf_counter() - self.start_time
+        self.executor.shutdown(wait=False)
+        
+        convert_start = time.perf_counter()
+        self.sprites = {}
+        per_file = {}
+        for name, path, (image, decode_time) in decoded:
+            per_file[name] = decode_time
+            if image is None:
+                print(f"Could not load sprite: {path}")
+                sprite = self.asset_manager._create_placeholder_surface(TILE_SIZE, TILE_SIZE, WHITE)
+            else:
+                # Display-format conversion must happen on the main thread
+                sprite = image.convert_alpha()
+            key = ('sprite', name)
+            if key not in self.asset_manager.residency:
+                self.asset_manager.residency.put(key, sprite)
+            self.sprites[name] = sprite
+        
+        self.timings = {
+            'decode_wall': decode_wall,
+            'decode_total': sum(per_file.values()),
+            'convert': time.perf_counter() - convert_start,
+            'per_file': per_file
+        }
+        return self.sprites
+
 
 class AssetManager:
     def __init__(self):
+        # Generated sprites (placeholders) and small loaded sprites, pinned and packed into the atlas
         self.sprites = {}
-        self.sounds = {}
         self.fonts = {}
+        
+        # Everything that can be reloaded from disk lives under a memory budget:
+        #   ('sprite', name)                 large named sprites backed by PNG files
+        #   ('file', path)                   sprites loaded by file path (e.g. custom enemy sprites)
+        #   ('scaled_name', name, size)      scaled named sprites
+        #   ('scaled_file', path, size)      scaled sprites loaded by file path
+        #   ('sound', name)                  sounds
+        # Files that failed to load are remembered (residency.missing) so they are not retried every frame.
+        self.residency = AssetResidency()
+        self.sprite_paths = {}  # name -> source path
+        self.sound_paths = {}  # name -> source path
+        
+        # Decoded, pre-scaled sprites on disk; named PNGs are decoded lazily when it is warm
+        self.disk_cache = AssetCache()
+        
+        # Pre-baked render variants (entity bodies, shadows, HP bar frames, labels)
+        self.variants = {}
+        
+        # Reusable overlay surfaces (night tint, darkening, glows)
+        self.overlays = OverlayPool()
+        
+        # Small named sprites live in atlas pages, self.sprites holds subsurface views
+        self.atlas = TextureAtlas()
+        self.atlas_packed = False
+        
+        # Startup timing breakdown (seconds) for tracking time-to-first-frame
+        self.startup_timings = {}
+        
+        start = time.perf_counter()
         self._load_assets()
+        atlas_start = time.perf_counter()
+        self._pack_atlas()
+        self.startup_timings['atlas'] = time.perf_counter() - atlas_start
+        self.startup_timings['total'] = time.perf_counter() - start
     
     def _load_assets(self):
         """Load all assets - try PNG files first, fallback to placeholders"""
-        # Load building sprites
-        self._load_building_sprites()
-        
-        # Load background
-        self._load_background()
+        # Decode building and background PNGs on worker threads
+        entries = self._get_building_sprite_paths() + self._get_background_paths()
+        self.sprite_paths.update(entries)
+        # Files whose scaled variants are all cached on disk are not decoded at all
+        entries = [(name, path) for name, path in entries if not self.disk_cache.is_warm(path)]
+        handle = self.load_sprites_async(entries)
         
         # Placeholder sprites (will be replaced with actual images if PNGs not found)
+        placeholder_start = time.perf_counter()
+        self._create_placeholders()
+        self.startup_timings['placeholders'] = time.perf_counter() - placeholder_start
+        
+        handle.result()
+        self.startup_timings.update(handle.timings)
+    
+    def _create_placeholders(self):
+        """Create placeholder sprites for assets without PNG files"""
         if 'player' not in self.sprites:
             self.sprites['player'] = self._create_placeholder_surface(TILE_SIZE, TILE_SIZE, BLUE)
         if 'enemy' not in self.sprites:
@@ -33,8 +142,47 @@ class AssetManager:
         if 'coin' not in self.sprites:
             self.sprites['coin'] = self._create_placeholder_surface(16, 16, YELLOW)
     
-    def _load_building_sprites(self):
-        """Load building and campfire sprites from PNG files"""
+    def _pack_atlas(self):
+        """Move all small sprites into atlas pages"""
+        # Largest first packs shelves more tightly
+        names = sorted(self.sprites, key=lambda n: self.sprites[n].get_height(), reverse=True)
+        for name in names:
+            self._pack_sprite(name)
+        # Pages only keep the area the packed sprites use
+        self.atlas.trim()
+        self._refresh_atlas_views()
+        self.atlas_packed = True
+    
+    def _pack_sprite(self, name):
+        """Replace a sprite with a subsurface view into the atlas if it is small enough"""
+        sprite = self.sprites[name]
+        width, height = sprite.get_size()
+        if width > ATLAS_MAX_SPRITE_SIZE or height > ATLAS_MAX_SPRITE_SIZE:
+            return
+        version = self.atlas.version
+        packed = self.atlas.add(name, sprite)
+        if packed is not None:
+            self.sprites[name] = packed
+            if self.atlas_packed and self.atlas.version != version:
+                # A page grew, older views still point at its previous surface
+                self._refresh_atlas_views()
+    
+    def _refresh_atlas_views(self):
+        """Point every packed sprite at its current atlas page"""
+        for name in self.atlas.regions:
+            self.sprites[name] = self.atlas.get_view(name)
+    
+    def load_sprites_async(self, entries):
+        """
+        Start decoding (name, path) image entries on a thread pool.
+        Returns an AssetLoadHandle; call result() on the main thread to convert and store them.
+        """
+        executor = ThreadPoolExecutor(max_workers=ASSET_LOADER_THREADS)
+        return AssetLoadHandle(self, entries, executor)
+    
+    def _get_building_sprite_paths(self):
+        """Get (name, path) entries for building and campfire sprites"""
+        entries = []
         building_types = ['bedroom', 'smith', 'tailor', 'witch', 'fireplace']
         for building_type in building_types:
             sprite_name = f'building_{building_type}'
@@ -42,25 +190,27 @@ class AssetManager:
             sprite_path = os.path.join(SPRITES_PATH, 'buildings', f'{building_type}.png')
             if not os.path.exists(sprite_path):
                 sprite_path = os.path.join(SPRITES_PATH, f'{building_type}.png')
-            self.load_sprite(sprite_name, sprite_path)
+            entries.append((sprite_name, sprite_path))
+        return entries
     
-    def _load_background(self):
-        """Load background images from PNG files"""
+    def _get_background_paths(self):
+        """Get (name, path) entries for background images"""
         # Load general background
         bg_path = os.path.join(SPRITES_PATH, 'background.png')
         if not os.path.exists(bg_path):
             alt_path = os.path.join(ASSETS_PATH, 'background.png')
             if os.path.exists(alt_path):
                 bg_path = alt_path
-        self.load_sprite('background', bg_path)
         
+
         # Load main base background (if exists, will be used for main map)
         bg_main_path = os.path.join(SPRITES_PATH, 'background_main.png')
         if not os.path.exists(bg_main_path):
             bg_main_path = os.path.join(SPRITES_PATH, 'background_main_base.png')
         if not os.path.exists(bg_main_path):
             bg_main_path = os.path.join(ASSETS_PATH, 'background_main.png')
-        self.load_sprite('background_main', bg_main_path)
+        
+        return [('background', bg_path), ('background_main', bg_main_path)]
     
     def _create_placeholder_surface(self, width, height, color):
         """Create a colored rectangle as placeholder"""
@@ -70,27 +220,122 @@ class AssetManager:
     
     def load_sprite(self, name, path):
         """Load sprite from file"""
-        if name not in self.sprites:
-            try:
-                self.sprites[name] = pygame.image.load(path).convert_alpha()
-            except:
-                print(f"Could not load sprite: {path}")
-                self.sprites[name] = self._create_placeholder_surface(TILE_SIZE, TILE_SIZE, WHITE)
-        return self.sprites[name]
+        if name not in self.sprites and name not in self.sprite_paths:
+            sprite = self._decode_named_sprite(path)
+            width, height = sprite.get_size()
+            if width <= ATLAS_MAX_SPRITE_SIZE and height <= ATLAS_MAX_SPRITE_SIZE:
+                # Small sprites are pinned and packed as they arrive
+                self.sprites[name] = sprite
+                if self.atlas_packed:
+                    self._pack_sprite(name)
+            else:
+                # Large sprites stay reloadable under the memory budget
+                self.sprite_paths[name] = path
+                self.residency.put(('sprite', name), sprite)
+        return self.get_sprite(name)
+    
+    def _decode_named_sprite(self, path):
+        """Decode a named sprite's PNG, white placeholder if it can't be loaded"""
+        try:
+            return pygame.image.load(path).convert_alpha()
+        except (pygame.error, OSError):
+            print(f"Could not load sprite: {path}")
+            return self._create_placeholder_surface(TILE_SIZE, TILE_SIZE, WHITE)
+    
+    def has_sprite(self, name):
+        """Check if a named sprite is loaded or can be loaded on demand"""
+        return name in self.sprites or name in self.sprite_paths
+    
+    def get_scaled_sprite(self, name, size):
+        """Get named sprite scaled to size, cached in memory and on disk per (name, size)"""
+        size = (int(size[0]), int(size[1]))
+        return self.residency.get(('scaled_name', name, size), self._build_scaled_sprite, name, size)
+    
+    def _build_scaled_sprite(self, name, size):
+        """Scale a named sprite, reading/writing the disk cache for file-backed sprites"""
+        path = self.sprite_paths.get(name)
+        sprite = self.disk_cache.load(path, size) if path else None
+        if sprite is None:
+            sprite = self.get_sprite(name)
+            if sprite is not None and sprite.get_size() != size:
+                sprite = pygame.transform.scale(sprite, size)
+                if path:
+                    self.disk_cache.store(path, size, sprite)
+        return sprite
+    
+    def load_file_sprite(self, path):
+        """Load sprite by file path, returns None if the file can't be loaded"""
+        return self.residency.get(('file', path), self._decode_file_sprite, path)
+    
+    def _decode_file_sprite(self, path):
+        """Decode sprite by file path, None if it can't be loaded"""
+        try:
+            return pygame.image.load(path).convert_alpha()
+        except (pygame.error, OSError):
+            print(f"Could not load sprite: {path}")
+            return None
+    
+    def load_scaled_sprite(self, path, size):
+        """Load sprite by file path scaled to size, cached per (path, size)"""
+        size = (int(size[0]), int(size[1]))
+        return self.residency.get(('scaled_file', path, size), self._build_scaled_file_sprite, path, size)
+    
+    def _build_scaled_file_sprite(self, path, size):
+        """Scale a sprite loaded by file path, reading/writing the disk cache"""
+        sprite = self.disk_cache.load(path, size)
+        if sprite is None:
+            sprite = self.load_file_sprite(path)
+            if sprite is not None and sprite.get_size() != size:
+                sprite = pygame.transform.scale(sprite, size)
+                self.disk_cache.store(path, size, sprite)
+        return sprite
+    
+    def get_variant(self, key, builder):
+        """Get a baked surface for key, calling builder() only the first time"""
+        variant = self.variants.get(key)
+        if variant is None:
+            variant = builder()
+            self.variants[key] = variant
+        return variant
+    
+    def get_shadow(self, width, height, alpha):
+        """Get a baked semi-transparent black shadow surface"""
+        key = ('shadow', width, height, alpha)
+        variant = self.variants.get(key)
+        if variant is None:
+            variant = pygame.Surface((width, height), pygame.SRCALPHA)
+            variant.fill((0, 0, 0, alpha))
+            self.variants[key] = variant
+        return variant
     
     def get_sprite(self, name):
-        """Get cached sprite"""
-        return self.sprites.get(name, None)
+        """Get sprite, (re)decoding file-backed sprites if they are not resident"""
+        sprite = self.sprites.get(name)
+        if sprite is None and name in self.sprite_paths:
+            sprite = self.residency.get(('sprite', name), self._decode_named_sprite, self.sprite_paths[name])
+        return sprite
     
     def load_sound(self, name, path):
         """Load sound from file"""
-        if name not in self.sounds:
-            try:
-                self.sounds[name] = pygame.mixer.Sound(path)
-            except:
-                print(f"Could not load sound: {path}")
-        return self.sounds.get(name, None)
+        if name not in self.sound_paths:
+            self.sound_paths[name] = path
+        return self.get_sound(name)
+    
+    def _decode_sound(self, path):
+        """Load sound from file, None if it can't be loaded"""
+        try:
+            return pygame.mixer.Sound(path)
+        except (pygame.error, OSError):
+            print(f"Could not load sound: {path}")
+            return None
     
     def get_sound(self, name):
-        """Get cached sound"""
-        return self.sounds.get(name, None)
\ No newline at end of file
+        """Get sound, reloading it if it was evicted"""
+        path = self.sound_paths.get(name)
+        if path is None:
+            return None
+        return self.residency.get(('sound', name), self._decode_sound, path)
+    
+    def get_residency_stats(self):
+        """Get memory residency stats (resident bytes, hit rate, evictions)"""
+        return self.residency.get_stats()
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+src/managers/asset_residency.py
+Memory-budgeted LRU residency for reloadable assets
+"""
+import pygame
+from collections import OrderedDict
+from src.config.settings import *
+
+class AssetResidency:
+    """
+    Keeps reloadable assets (decoded PNGs, scaled sprites, sounds) under a byte budget.
+    Entries are evicted least-recently-used first; get() reloads an evicted
+    entry transparently through the loader it is given. Assets that failed to
+    load (None) are remembered in a separate set that eviction never touches,
+    so missing files are not retried.
+    """
+
+    def __init__(self, budget_bytes=ASSET_MEMORY_BUDGET):
+        self.budget_bytes = budget_bytes
+        self.entries = OrderedDict()  # key -> (asset, bytes)
+        self.resident_bytes = 0
+        self.evicted_keys = set()
+        self.missing = set()  # Keys whose loader returned None
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reloads = 0
+
+    @staticmethod
+    def get_size(asset):
+        """Get approximate memory size of an asset in bytes"""
+        if asset is None:
+            return 0
+        if isinstance(asset, pygame.Surface):
+            return asset.get_width() * asset.get_height() * asset.get_bytesize()
+        if isinstance(asset, pygame.mixer.Sound):
+            mixer_settings = pygame.mixer.get_init()
+            if not mixer_settings:
+                return 0
+            frequency, sample_format, channels = mixer_settings
+            return int(asset.get_length() * frequency) * channels * (abs(sample_format) // 8)
+        return 0
+
+    def __contains__(self, key):
+        return key in self.entries or key in self.missing
+
+    def get(self, key, loader, *args):
+        """Get asset for key, calling loader(*args) to (re)load it on a miss"""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        if key in self.missing:
+            self.hits += 1
+            return None
+
+        self.misses += 1
+        if key in self.evicted_keys:
+            self.reloads += 1
+            self.evicted_keys.discard(key)
+        asset = loader(*args)
+        self.put(key, asset)
+        return asset
+
+    def put(self, key, asset):
+        """Store asset as most recently used and evict others if over budget"""
+        self.discard(key)
+        if asset is None:
+            self.missing.add(key)
+            return
+        size = self.get_size(asset)
+        self.entries[key] = (asset, size)
+        self.resident_bytes += size
+        self._evict()
+
+    def discard(self, key):
+        """Remove an entry without counting it as an eviction"""
+        self.missing.discard(key)
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.resident_bytes -= entry[1]
+
+    def _evict(self):
+        """Drop least-recently-used entries until under budget (newest entry always stays)"""
+        while self.resident_bytes > self.budget_bytes and len(self.entries) > 1:
+            key, (_, size) = self.entries.popitem(last=False)
+            self.resident_bytes -= size
+            self.evicted_keys.add(key)
+            self.evictions += 1
+
+    def get_stats(self):
+        """Get residency stats: resident bytes, hit rate, evictions, ..."""
+        lookups = self.hits + self.misses
+        return {
+            'resident_bytes': self.resident_bytes,
+            'budget_bytes': self.budget_bytes,
+            'entries': len(self.entries),
+            'missing': len(self.missing),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'reloads': self.reloads
+        }
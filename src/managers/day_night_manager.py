@@ -3,9 +3,11 @@ src/managers/day_night_manager.py
 Day/night cycle management
 """
 from src.config.settings import *
+from src.core.events import EventBus, DayChanged
 
 class DayNightManager:
-    def __init__(self):
+    def __init__(self, events=None):
+        self.events = events or EventBus()
         self.time = 0  # Time in seconds
         self.cycle_duration = DAY_NIGHT_CYCLE_DURATION
         self.day_count = 0
@@ -20,6 +22,7 @@ class DayNightManager:
         if current_day > self.last_day:
             self.day_count += 1
             self.last_day = current_day
+            self.events.publish(DayChanged(self.day_count))
     
     def get_time_of_day(self):
         """Get current time in cycle (0.0 to 1.0)"""
@@ -47,10 +50,6 @@ class DayNightManager:
         else:  # Night
             return 150
     
-    def should_reset_map(self):
-        """Check if exploration map should reset"""
-        return self.day_count > 0 and self.day_count % EXPLORATION_RESET_DAYS == 0
-    
     def get_day_count(self):
         """Get current day"""
         return self.day_count
\ No newline at end of file
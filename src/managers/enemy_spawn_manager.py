@@ -4,9 +4,12 @@ Enemy spawn system with day/night/depth conditions
 """
 from src.config.settings import *
 from src.entities.enemy import Enemy
+from src.core.rng import RandomService
 
 class EnemySpawnManager:
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng or RandomService()  # Spawn rolls and positions use the 'spawn' stream
+        
         # Enemy spawn configurations
         # Each entry: {
         #   'enemy_type': str,
@@ -70,7 +73,7 @@ class EnemySpawnManager:
         
         return True
     
-    def update(self, dt, game_map, day_night_manager, player_spawn_y, current_player_y):
+    def update(self, dt, game_map, day_night_manager, player_spawn_y, current_player_y, current_player_x=None):
         """Update spawn system and spawn enemies if conditions are met"""
         if not day_night_manager:
             return
@@ -88,26 +91,56 @@ class EnemySpawnManager:
                 self.spawn_timers[enemy_type] = 0.0
                 
                 # Count existing enemies of this type
-                existing_count = sum(1 for e in game_map.enemies if e.enemy_type == enemy_type)
+                existing_count = game_map.get_enemy_count(enemy_type)
                 
                 # Check if we can spawn (conditions + max count)
                 if (existing_count < config['max_count'] and 
                     self.can_spawn(enemy_type, is_day, depth)):
                     
                     # Roll for spawn
-                    import random
-                    if random.random() < config['spawn_rate']:
+                    if self.rng.spawn.random() < config['spawn_rate']:
                         sprite_path = config.get('sprite_path', None)
-                        self._spawn_enemy(enemy_type, game_map, current_player_y, sprite_path)
+                        if current_player_x is None:
+                            current_player_x = game_map.width * TILE_SIZE // 2
+                        self._spawn_enemy(enemy_type, game_map, (current_player_x, current_player_y),
+                                          player_spawn_y, sprite_path)
+    
+    def _spawn_enemy(self, enemy_type, game_map, player_pos, player_spawn_y, sprite_path=None):
+        """Spawn an enemy on free ground around the player, returns False if no cell was found"""
+        return len(self._spawn_group(enemy_type, 1, game_map, player_pos, player_spawn_y, sprite_path)) == 1
+    
+    def spawn_wave(self, enemy_type, count, game_map, player_pos, player_spawn_y, ignore_max_count=False):
+        """
+        Spawn up to count enemies of a type around the player in one call (horde events).
+        Respects the type's max_count unless ignore_max_count; returns the spawned enemies.
+        """
+        if enemy_type not in self.enemy_configs:
+            return []
+        config = self.enemy_configs[enemy_type]
+        if not ignore_max_count:
+            count = min(count, config['max_count'] - game_map.get_enemy_count(enemy_type))
+        if count <= 0:
+            return []
+        return self._spawn_group(enemy_type, count, game_map, player_pos, player_spawn_y,
+                                 config.get('sprite_path', None))
     
-    def _spawn_enemy(self, enemy_type, game_map, player_y, sprite_path=None):
-        """Spawn an enemy near the player"""
-        import random
+    def _spawn_group(self, enemy_type, count, game_map, player_pos, player_spawn_y, sprite_path=None):
+        """Place up to count enemies on free ground around the player"""
+        conditions = self.enemy_configs[enemy_type]['spawn_conditions']
+        
+        # Only rows deep enough (or shallow enough) for this enemy type.
+        # Depth is measured like in update(): rows above the spawn row are depth 0
+        spawn_row = player_spawn_y // TILE_SIZE
+        min_depth = conditions.get('min_depth', 0)
+        min_row = spawn_row + min_depth if min_depth > 0 else None
+        max_depth = conditions.get('max_depth', None)
+        max_row = spawn_row + max_depth if max_depth is not None else None
         
-        # Spawn at random position on map (will be improved to spawn near player)
-        spawn_x = random.randint(0, game_map.width - 1)
-        spawn_y = random.randint(0, game_map.height - 1)
+        # Off screen, but close enough to matter
+        center = (int(player_pos[0]) // TILE_SIZE, int(player_pos[1]) // TILE_SIZE)
+        cells = game_map.spawn_index.sample_many(center, SPAWN_MIN_DISTANCE, SPAWN_MAX_DISTANCE,
+                                                 self.rng.spawn, count, min_row, max_row)
         
-        # Convert to pixel coordinates and spawn
-        game_map.spawn_enemy(spawn_x, spawn_y, enemy_type, sprite_path)
+        # Cell is the feet tile; enemies are 2 tiles tall
+        return game_map.spawn_enemies([(x, y - 1) for x, y in cells], enemy_type, sprite_path)
 
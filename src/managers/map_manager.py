@@ -3,11 +3,13 @@ src/managers/map_manager.py
 Map loading and management
 """
 from src.world.map import Map
+from src.core.events import EventBus
 from src.config.settings import *
 
 class MapManager:
-    def __init__(self, asset_manager):
+    def __init__(self, asset_manager, events=None):
         self.asset_manager = asset_manager
+        self.events = events or EventBus()
         self.maps = {}
         self.current_map = None
     
@@ -21,7 +23,7 @@ class MapManager:
         elif map_type == MAP_EXPLORATION:
             new_map = self._create_exploration_map()
         else:
-            new_map = Map(40, 30, self.asset_manager)
+            new_map = Map(40, 30, self.asset_manager, events=self.events)
         
         self.maps[map_type] = new_map
         self.current_map = new_map
@@ -30,7 +32,7 @@ class MapManager:
     def _create_main_map(self):
         """Create main village map"""
         from src.world.map import Map
-        game_map = Map(50, 30, self.asset_manager, map_type=MAP_MAIN)
+        game_map = Map(50, 30, self.asset_manager, map_type=MAP_MAIN, events=self.events)
         
         # Ground blocks for collision (invisible, green block is rendered separately)
         # Ground starts at y=25 (in grid coordinates)
@@ -64,7 +66,7 @@ class MapManager:
         # Increase depth by 4 screen lengths: 1080 * 4 / 32 = 135 tiles
         # Original height was 40, so new height is 40 + 135 = 175 tiles
         map_height = 40 + (SCREEN_HEIGHT * 4) // TILE_SIZE
-        game_map = Map(map_width, map_height, self.asset_manager, map_type=MAP_EXPLORATION)
+        game_map = Map(map_width, map_height, self.asset_manager, map_type=MAP_EXPLORATION, events=self.events)
         
         # Ground level (non-destructible base)
         ground_y = 35
@@ -0,0 +1,49 @@
+"""
+src/managers/overlay_pool.py
+Reusable overlay surfaces (night tint, background darkening, glows, outlines)
+"""
+import pygame
+from src.config.settings import *
+
+class OverlayPool:
+    """
+    Keeps overlay surfaces between frames instead of allocating them every frame.
+    Solid fills are refilled only when their color changes and re-alpha'd only
+    when their alpha changes; shapes are drawn once per (key, size).
+    """
+
+    def __init__(self):
+        self.fills = {}  # key -> [surface, color, alpha]
+        self.shapes = {}  # (key, size) -> surface
+
+    def resize(self, width, height):
+        """Drop fills sized for the old window (VIDEORESIZE), they are reallocated on next use"""
+        self.fills = {key: entry for key, entry in self.fills.items()
+                      if entry[0].get_size() == (width, height)}
+
+    def get_fill(self, key, size, color, alpha=None):
+        """Get a solid overlay of size filled with color (per-surface alpha if given)"""
+        entry = self.fills.get(key)
+        if entry is None or entry[0].get_size() != size:
+            entry = [pygame.Surface(size), None, None]
+            self.fills[key] = entry
+
+        surface = entry[0]
+        if entry[1] != color:
+            surface.fill(color)
+            entry[1] = color
+        if entry[2] != alpha:
+            surface.set_alpha(alpha)
+            entry[2] = alpha
+        return surface
+
+    def get_shape(self, key, size, draw):
+        """Get a transparent surface of size, drawn once by draw(surface)"""
+        shape_key = (key, size)
+        surface = self.shapes.get(shape_key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            surface.fill((0, 0, 0, 0))
+            draw(surface)
+            self.shapes[shape_key] = surface
+        return surface
@@ -10,7 +10,7 @@ class SaveManager:
     def __init__(self, save_file="save_data.json"):
         self.save_file = save_file
     
-    def save_game(self, player, day_night_manager, quest_manager, current_map_type):
+    def save_game(self, player, day_night_manager, quest_manager, current_map_type, rng=None):
         """Save game state to file"""
         save_data = {
             'player': {
@@ -40,6 +40,8 @@ class SaveManager:
                 'current_map': current_map_type
             }
         }
+        if rng:
+            save_data['rng'] = {'seed': rng.seed}
         
         try:
             with open(self.save_file, 'w') as f:
@@ -50,7 +52,7 @@ class SaveManager:
             print(f"Save failed: {e}")
             return False
     
-    def load_game(self, player, day_night_manager, quest_manager):
+    def load_game(self, player, day_night_manager, quest_manager, rng=None):
         """Load game state from file"""
         if not os.path.exists(self.save_file):
             print("No save file found")
@@ -69,6 +71,7 @@ class SaveManager:
             player.weapon_damage = save_data['player']['weapon_damage']
             player.inventory.items = save_data['player']['inventory']['items']
             player.inventory.item_counts = save_data['player']['inventory']['counts']
+            player.inventory.rebuild_index()
             
             for slot, item in save_data['player']['equipment'].items():
                 player.equipment.slots[slot] = item
@@ -83,6 +86,10 @@ class SaveManager:
             quest_manager.tutorial_stage = save_data['quests']['tutorial_stage']
             quest_manager.completed_quests = save_data['quests']['completed_quests']
             
+            # Restore random streams (older saves have no seed)
+            if rng and 'rng' in save_data:
+                rng.reseed(save_data['rng']['seed'])
+            
             # Return current map type
             print("Game loaded successfully")
             return save_data['game_state']['current_map']
@@ -0,0 +1,129 @@
+"""
+src/managers/texture_atlas.py
+Texture atlas packing for small sprites
+"""
+import pygame
+from src.config.settings import *
+
+class TextureAtlas:
+    """
+    Packs small sprites into a few large SRCALPHA pages using a shelf packer.
+    Packed sprites are returned as subsurface views of their page (no copies),
+    so batched blits can draw many sprites from the same source surface.
+
+    Page surfaces start small and double (up to page_size) as sprites are
+    added, and trim() shrinks them to the packed area. Resizing reallocates a
+    page, so version is bumped and views must be fetched again with get_view().
+    """
+
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, padding=1, min_page_size=ATLAS_MIN_PAGE_SIZE):
+        self.page_size = page_size
+        self.padding = padding
+        self.min_page_size = min(min_page_size, page_size)
+        self.pages = []  # Each page: {'surface', 'shelves': [[y, height, next_x]], 'next_y'}
+        self.regions = {}  # name -> (page index, rect)
+        self.version = 0  # Bumped whenever a page surface is reallocated
+
+    def can_pack(self, surface):
+        """Check if a sprite is small enough to fit on a page"""
+        width, height = surface.get_size()
+        limit = self.page_size - self.padding
+        return 0 < width <= limit and 0 < height <= limit
+
+    def add(self, name, surface):
+        """Pack sprite into the atlas, returns subsurface view or None if it doesn't fit"""
+        if not self.can_pack(surface):
+            return None
+
+        width, height = surface.get_size()
+        page_index, rect = self._allocate(width, height)
+        self._fit(self.pages[page_index], rect.right, rect.bottom)
+        page = self.pages[page_index]['surface']
+
+        # Copy pixels exactly (additive blit onto the cleared page keeps colour and alpha)
+        if not surface.get_flags() & pygame.SRCALPHA:
+            surface = surface.convert_alpha()
+        page.blit(surface, rect.topleft, special_flags=pygame.BLEND_RGBA_ADD)
+
+        self.regions[name] = (page_index, rect)
+        return page.subsurface(rect)
+
+    def get_view(self, name):
+        """Get a subsurface view of a packed sprite on its current page surface"""
+        page_index, rect = self.regions[name]
+        return self.pages[page_index]['surface'].subsurface(rect)
+
+    def _allocate(self, width, height):
+        """Find space for a width x height sprite, opening shelves/pages as needed"""
+        padded_width = width + self.padding
+        padded_height = height + self.padding
+
+        # Best fit: existing shelf with the least wasted height
+        best = None
+        for page_index, page in enumerate(self.pages):
+            for shelf in page['shelves']:
+                shelf_y, shelf_height, next_x = shelf
+                if shelf_height >= padded_height and next_x + padded_width <= self.page_size:
+                    waste = shelf_height - padded_height
+                    if best is None or waste < best[0]:
+                        best = (waste, page_index, shelf)
+        if best:
+            _, page_index, shelf = best
+            rect = pygame.Rect(shelf[2], shelf[0], width, height)
+            shelf[2] += padded_width
+            return page_index, rect
+
+        # Open a new shelf on the first page with room left
+        for page_index, page in enumerate(self.pages):
+            if page['next_y'] + padded_height <= self.page_size:
+                return page_index, self._open_shelf(page, padded_width, padded_height, width, height)
+
+        # Start a new (small) page, grown by _fit once the sprite is placed
+        surface = pygame.Surface((self.min_page_size, self.min_page_size), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        page = {'surface': surface, 'shelves': [], 'next_y': 0}
+        self.pages.append(page)
+        return len(self.pages) - 1, self._open_shelf(page, padded_width, padded_height, width, height)
+
+    def _open_shelf(self, page, padded_width, padded_height, width, height):
+        """Add a shelf at the bottom of the page and place the sprite at its start"""
+        shelf_y = page['next_y']
+        page['shelves'].append([shelf_y, padded_height, padded_width])
+        page['next_y'] += padded_height
+        return pygame.Rect(0, shelf_y, width, height)
+
+    def _fit(self, page, width, height):
+        """Grow a page surface (doubling, up to page_size) so it covers width x height"""
+        page_width, page_height = page['surface'].get_size()
+        if width <= page_width and height <= page_height:
+            return
+        while page_width < width:
+            page_width *= 2
+        while page_height < height:
+            page_height *= 2
+        self._resize(page, min(page_width, self.page_size), min(page_height, self.page_size))
+
+    def _resize(self, page, width, height):
+        """Reallocate a page surface, keeping the pixels that fit"""
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        surface.blit(page['surface'], (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        page['surface'] = surface
+        self.version += 1
+
+    def trim(self):
+        """Shrink every page to the area its sprites use"""
+        for page in self.pages:
+            width = max(shelf[2] for shelf in page['shelves'])
+            height = page['next_y']
+            if (width, height) != page['surface'].get_size():
+                self._resize(page, width, height)
+
+    def get_page_bytes(self):
+        """Get pixel memory held by all pages"""
+        return sum(page['surface'].get_bytesize() * page['surface'].get_width() * page['surface'].get_height()
+                   for page in self.pages)
+
+    def get_page_count(self):
+        """Get number of atlas pages"""
+        return len(self.pages)
@@ -2,6 +2,7 @@
 src/systems/combat.py
 Combat system for damage calculation and effects
 """
+import random
 
 class CombatSystem:
     @staticmethod
@@ -25,7 +26,6 @@ class CombatSystem:
         return knockback_x, knockback_y
     
     @staticmethod
-    def is_critical_hit(chance=0.1):
-        """Check for critical hit"""
-        import random
-        return random.random() < chance
\ No newline at end of file
+    def is_critical_hit(chance=0.1, rng=None):
+        """Check for critical hit (rng: the RandomService's 'combat' stream for reproducible runs)"""
+        return (rng or random).random() < chance
\ No newline at end of file
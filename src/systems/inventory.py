@@ -2,13 +2,50 @@
 src/systems/inventory.py
 Inventory management system
 """
+import heapq
+from src.core.events import EventBus, ItemAdded
 
 class Inventory:
-    def __init__(self, total_slots):
+    """
+    Slot inventory with an index kept alongside items/item_counts:
+    item type -> occupied slots, per-type totals, a min-heap of free slots
+    and an occupied count, so lookups don't scan every slot.
+    Anything that assigns items/item_counts directly must call rebuild_index().
+    """
+    
+    def __init__(self, total_slots, events=None):
+        self.events = events or EventBus()
         self.visible_slots = 6
         self.hidden_slots = total_slots - self.visible_slots
         self.items = [None] * total_slots
         self.item_counts = [0] * total_slots
+        self.version = 0  # Bumped on every change (cheap UI change check)
+        self.rebuild_index()
+    
+    def rebuild_index(self):
+        """Rebuild the slot index from items/item_counts (e.g. after loading a save)"""
+        self.slots_by_type = {}  # item type -> set of slots holding it
+        self.totals = {}  # item type -> total count
+        self.free_slots = []  # min-heap, so the first empty slot is filled first
+        for i, item in enumerate(self.items):
+            if item is None:
+                self.free_slots.append(i)
+            else:
+                self.slots_by_type.setdefault(item, set()).add(i)
+                self.totals[item] = self.totals.get(item, 0) + self.item_counts[i]
+        heapq.heapify(self.free_slots)
+        self.occupied = len(self.items) - len(self.free_slots)
+        self.version += 1
+    
+    def add_slots(self, count):
+        """Grow the inventory by count hidden slots (backpack upgrades)"""
+        start = len(self.items)
+        self.items.extend([None] * count)
+        self.item_counts.extend([0] * count)
+        self.hidden_slots += count
+        for i in range(start, start + count):
+            heapq.heappush(self.free_slots, i)
+        self.version += 1
     
     def add_item(self, item_type, count=1):
         """
@@ -16,47 +53,53 @@ class Inventory:
         Fills visible slots first, then hidden slots
         """
         # Try to stack with existing items
-        for i in range(len(self.items)):
-            if self.items[i] == item_type:
-                self.item_counts[i] += count
-                return True
+        slots = self.slots_by_type.get(item_type)
+        if slots:
+            i = min(slots)
+            self.item_counts[i] += count
+        elif self.free_slots:
+            # First empty slot
+            i = heapq.heappop(self.free_slots)
+            self.items[i] = item_type
+            self.item_counts[i] = count
+            self.slots_by_type[item_type] = {i}
+            self.occupied += 1
+        else:
+            # Inventory full
+            return False
         
-        # Find first empty slot
-        for i in range(len(self.items)):
-            if self.items[i] is None:
-                self.items[i] = item_type
-                self.item_counts[i] = count
-                return True
-        
-        # Inventory full
-        return False
+        self.totals[item_type] = self.totals.get(item_type, 0) + count
+        self.version += 1
+        self.events.publish(ItemAdded(self, item_type, count))
+        return True
     
     def remove_item(self, item_type, count=1):
         """Remove item from inventory, returns True if successful"""
-        for i in range(len(self.items)):
-            if self.items[i] == item_type:
-                if self.item_counts[i] >= count:
-                    self.item_counts[i] -= count
-                    if self.item_counts[i] == 0:
-                        self.items[i] = None
-                    return True
+        for i in sorted(self.slots_by_type.get(item_type, ())):
+            if self.item_counts[i] >= count:
+                self.item_counts[i] -= count
+                if self.item_counts[i] == 0:
+                    self.items[i] = None
+                    slots = self.slots_by_type[item_type]
+                    slots.discard(i)
+                    if not slots:
+                        del self.slots_by_type[item_type]
+                    heapq.heappush(self.free_slots, i)
+                    self.occupied -= 1
+                self.totals[item_type] -= count
+                if not self.totals[item_type]:
+                    del self.totals[item_type]
+                self.version += 1
+                return True
         return False
     
     def has_item(self, item_type, count=1):
         """Check if inventory has enough of an item"""
-        total = 0
-        for i in range(len(self.items)):
-            if self.items[i] == item_type:
-                total += self.item_counts[i]
-        return total >= count
+        return self.totals.get(item_type, 0) >= count
     
     def get_item_count(self, item_type):
         """Get total count of an item"""
-        total = 0
-        for i in range(len(self.items)):
-            if self.items[i] == item_type:
-                total += self.item_counts[i]
-        return total
+        return self.totals.get(item_type, 0)
     
     def get_visible_items(self):
         """Get items in visible slots"""
@@ -71,4 +114,4 @@ class Inventory:
     
     def is_full(self):
         """Check if inventory is completely full"""
-        return all(item is not None for item in self.items)
\ No newline at end of file
+        return self.occupied == len(self.items)
\ No newline at end of file
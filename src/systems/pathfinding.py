@@ -0,0 +1,297 @@
+"""
+src/systems/pathfinding.py
+Pathfinding helpers for enemy navigation
+"""
+import heapq
+from collections import deque
+from src.config.settings import *
+
+# 4-connected neighbour offsets (tile coordinates)
+NEIGHBOUR_OFFSETS = ((1, 0), (-1, 0), (0, -1), (0, 1))
+
+
+class FlowField:
+    """
+    Breadth-first flow field from the player's tile, shared by all chasing enemies.
+
+    Every reachable cell stores its distance to the player and the step (dx, dy)
+    toward a neighbour that is one tile closer, so enemies only need a dict lookup
+    per frame. The field is bounded to FLOW_FIELD_RADIUS steps around the player.
+    """
+
+    def __init__(self, game_map, radius=FLOW_FIELD_RADIUS):
+        self.game_map = game_map
+        self.radius = radius
+        self.source = None
+        self.distances = {}
+        self.directions = {}
+        self.dirty = True
+
+    @staticmethod
+    def get_cell(rect):
+        """Get the tile an entity stands in (tile containing its feet)"""
+        return (rect.centerx // TILE_SIZE, (rect.bottom - 1) // TILE_SIZE)
+
+    def is_walkable(self, cell):
+        """Cell is walkable if it and the tile above are free (enemies are 2 tiles tall)"""
+        x, y = cell
+        return not self.game_map.is_solid_tile(x, y) and not self.game_map.is_solid_tile(x, y - 1)
+
+    def mark_dirty(self):
+        """Force a full rebuild on the next update (e.g. a block was added)"""
+        self.dirty = True
+
+    def update(self, player_rect):
+        """Rebuild the field if the player changed tile or the field was invalidated"""
+        cell = self.get_cell(player_rect)
+        if self.dirty or cell != self.source:
+            self.rebuild(cell)
+
+    def rebuild(self, source):
+        """Run a bounded BFS from the source cell"""
+        self.source = source
+        self.dirty = False
+        self.distances = {source: 0}
+        self.directions = {source: (0, 0)}
+
+        queue = deque([source])
+        while queue:
+            cell = queue.popleft()
+            distance = self.distances[cell]
+            if distance >= self.radius:
+                continue
+            for dx, dy in NEIGHBOUR_OFFSETS:
+                neighbour = (cell[0] + dx, cell[1] + dy)
+                if neighbour in self.distances or not self.is_walkable(neighbour):
+                    continue
+                self.distances[neighbour] = distance + 1
+                # Neighbour reaches the player by stepping back toward this cell
+                self.directions[neighbour] = (-dx, -dy)
+                queue.append(neighbour)
+
+    def on_tiles_opened(self, tiles):
+        """
+        Incrementally update the field after tiles became free (block removed).
+        Opening tiles can only shorten paths, so we relax distances outward
+        from the newly walkable cells instead of rebuilding the whole field.
+        """
+        if self.dirty or self.source is None or not tiles:
+            return
+
+        # A freed tile affects its own cell and the cell below (whose head it is)
+        candidates = set()
+        for x, y in tiles:
+            candidates.add((x, y))
+            candidates.add((x, y + 1))
+
+        heap = []
+        for cell in candidates:
+            if not self.is_walkable(cell):
+                continue
+            for dx, dy in NEIGHBOUR_OFFSETS:
+                neighbour = (cell[0] + dx, cell[1] + dy)
+                neighbour_distance = self.distances.get(neighbour)
+                if neighbour_distance is None:
+                    continue
+                distance = neighbour_distance + 1
+                if distance <= self.radius and distance < self.distances.get(cell, self.radius + 1):
+                    self.distances[cell] = distance
+                    self.directions[cell] = (dx, dy)
+                    heapq.heappush(heap, (distance, cell))
+
+        while heap:
+            distance, cell = heapq.heappop(heap)
+            if distance > self.distances.get(cell, self.radius + 1) or distance >= self.radius:
+                continue
+            for dx, dy in NEIGHBOUR_OFFSETS:
+                neighbour = (cell[0] + dx, cell[1] + dy)
+                if distance + 1 >= self.distances.get(neighbour, self.radius + 1):
+                    continue
+                if not self.is_walkable(neighbour):
+                    continue
+                self.distances[neighbour] = distance + 1
+                self.directions[neighbour] = (-dx, -dy)
+                heapq.heappush(heap, (distance + 1, neighbour))
+
+    def get_direction(self, cell):
+        """Get step (dx, dy) toward the player from a cell, or None if out of the field"""
+        return self.directions.get(cell)
+
+
+class HierarchicalPathfinder:
+    """
+    Two-level pathfinder for dungeons.
+
+    The dungeon is split into regions: every room is a region, and the open space
+    between rooms (corridors and the cave around them) is split into connected
+    areas. Routes are planned over the region graph and cached per
+    (start region, goal region). Tile-level A* then only refines the path inside
+    the current region and the next one on the route.
+    """
+
+    def __init__(self, dungeon):
+        self.dungeon = dungeon
+        self.version = 0
+        self.region_of = None  # (x, y) -> region id, built lazily
+        self.region_centers = []
+        self.portals = {}  # (region_a, region_b) -> (tile in a, tile in b)
+        self.route_cache = {}
+
+    def invalidate(self):
+        """Drop the region graph and cached routes (tiles changed)"""
+        self.version += 1
+        self.region_of = None
+        self.route_cache.clear()
+
+    def is_walkable(self, cell):
+        """Check if a tile inside the dungeon is free"""
+        x, y = cell
+        if not (0 <= x < self.dungeon.width and 0 <= y < self.dungeon.height):
+            return False
+        return not self.dungeon.is_solid_tile(x, y)
+
+    def get_region(self, cell):
+        """Get region id of a cell, or None if it is solid or outside the dungeon"""
+        if self.region_of is None:
+            self._build_regions()
+        return self.region_of.get(cell)
+
+    def _build_regions(self):
+        """Label walkable tiles with region ids and collect portals between regions"""
+        self.region_of = {}
+        self.region_centers = []
+        self.portals = {}
+
+        # Rooms first
+        for room in self.dungeon.rooms:
+            region_id = len(self.region_centers)
+            self.region_centers.append(room['center'])
+            for x in range(room['x'], room['x'] + room['width']):
+                for y in range(room['y'], room['y'] + room['height']):
+                    if self.is_walkable((x, y)):
+                        self.region_of[(x, y)] = region_id
+
+        # Remaining open space, split into connected areas
+        for x in range(self.dungeon.width):
+            for y in range(self.dungeon.height):
+                if (x, y) in self.region_of or not self.is_walkable((x, y)):
+                    continue
+                region_id = len(self.region_centers)
+                self.region_of[(x, y)] = region_id
+                tiles = [(x, y)]
+                queue = deque(tiles)
+                while queue:
+                    cx, cy = queue.popleft()
+                    for dx, dy in NEIGHBOUR_OFFSETS:
+                        neighbour = (cx + dx, cy + dy)
+                        if neighbour in self.region_of or not self.is_walkable(neighbour):
+                            continue
+                        self.region_of[neighbour] = region_id
+                        tiles.append(neighbour)
+                        queue.append(neighbour)
+                center_x = sum(t[0] for t in tiles) // len(tiles)
+                center_y = sum(t[1] for t in tiles) // len(tiles)
+                self.region_centers.append((center_x, center_y))
+
+        # Portals: first pair of adjacent tiles found between two regions
+        for cell, region_id in self.region_of.items():
+            for dx, dy in ((1, 0), (0, 1)):
+                neighbour = (cell[0] + dx, cell[1] + dy)
+                other = self.region_of.get(neighbour)
+                if other is None or other == region_id:
+                    continue
+                if (region_id, other) not in self.portals:
+                    self.portals[(region_id, other)] = (cell, neighbour)
+                    self.portals[(other, region_id)] = (neighbour, cell)
+
+    def find_route(self, start_region, goal_region):
+        """A* over the region graph, cached per (start region, goal region)"""
+        key = (start_region, goal_region)
+        if key in self.route_cache:
+            return self.route_cache[key]
+
+        neighbours = {}
+        for region_a, region_b in self.portals:
+            neighbours.setdefault(region_a, []).append(region_b)
+
+        def heuristic(region_id):
+            ax, ay = self.region_centers[region_id]
+            bx, by = self.region_centers[goal_region]
+            return abs(ax - bx) + abs(ay - by)
+
+        came_from = {start_region: None}
+        cost = {start_region: 0}
+        heap = [(heuristic(start_region), start_region)]
+        route = None
+        while heap:
+            _, region_id = heapq.heappop(heap)
+            if region_id == goal_region:
+                route = []
+                while region_id is not None:
+                    route.append(region_id)
+                    region_id = came_from[region_id]
+                route.reverse()
+                break
+            for other in neighbours.get(region_id, []):
+                ax, ay = self.region_centers[region_id]
+                bx, by = self.region_centers[other]
+                new_cost = cost[region_id] + abs(ax - bx) + abs(ay - by)
+                if new_cost < cost.get(other, float('inf')):
+                    cost[other] = new_cost
+                    came_from[other] = region_id
+                    heapq.heappush(heap, (new_cost + heuristic(other), other))
+
+        self.route_cache[key] = route
+        return route
+
+    def find_tile_path(self, start_cell, goal_cell, allowed_regions):
+        """Tile-level A* restricted to the given regions. Returns cells after start up to goal."""
+        def heuristic(cell):
+            return abs(cell[0] - goal_cell[0]) + abs(cell[1] - goal_cell[1])
+
+        came_from = {start_cell: None}
+        cost = {start_cell: 0}
+        heap = [(heuristic(start_cell), start_cell)]
+        while heap:
+            _, cell = heapq.heappop(heap)
+            if cell == goal_cell:
+                path = []
+                while cell != start_cell:
+                    path.append(cell)
+                    cell = came_from[cell]
+                path.reverse()
+                return path
+            for dx, dy in NEIGHBOUR_OFFSETS:
+                neighbour = (cell[0] + dx, cell[1] + dy)
+                if self.region_of.get(neighbour) not in allowed_regions:
+                    continue
+                new_cost = cost[cell] + 1
+                if new_cost < cost.get(neighbour, float('inf')):
+                    cost[neighbour] = new_cost
+                    came_from[neighbour] = cell
+                    heapq.heappush(heap, (new_cost + heuristic(neighbour), neighbour))
+        return []
+
+    def find_path(self, start_cell, goal_cell):
+        """
+        Get a partial tile path from start toward goal.
+        The path crosses the current region into the next one on the route
+        (ending at the goal if it is in the next region). Returns [] if there is
+        no route or both cells share a region (chase directly in that case).
+        """
+        start_region = self.get_region(start_cell)
+        goal_region = self.get_region(goal_cell)
+        if start_region is None or goal_region is None or start_region == goal_region:
+            return []
+
+        route = self.find_route(start_region, goal_region)
+        if not route or len(route) < 2:
+            return []
+
+        next_region = route[1]
+        if next_region == goal_region:
+            target = goal_cell
+        else:
+            # Exit tile of the next region toward the one after it
+            target = self.portals[(next_region, route[2])][0]
+        return self.find_tile_path(start_cell, target, (start_region, next_region))
@@ -0,0 +1,58 @@
+"""
+src/ui/profiler_overlay.py
+Debug overlay showing per-subsystem frame timings
+"""
+import pygame
+from src.config.settings import *
+from src.core.profiler import PROFILER_SECTIONS
+
+class ProfilerOverlay:
+    def __init__(self, x=10, y=10, width=260):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.font = pygame.font.Font(None, 18)
+        self.line_height = 16
+        self.histogram_height = 40
+        self.height = 24 + self.line_height * len(PROFILER_SECTIONS) + self.histogram_height + 16
+        
+        self.panel = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.panel.fill((0, 0, 0, 180))
+    
+    def render(self, screen, profiler):
+        """Render rolling averages/peaks per section and a frame time histogram"""
+        screen.blit(self.panel, (self.x, self.y))
+        
+        frame_times = profiler.frame_times
+        average_frame = sum(frame_times) / len(frame_times) if frame_times else 0.0
+        fps = 1000 / average_frame if average_frame else 0.0
+        header = self.font.render(f"Frame {average_frame:5.2f} ms  ({fps:4.0f} FPS)", True, WHITE)
+        screen.blit(header, (self.x + 6, self.y + 6))
+        
+        # Section rows: name, average, peak and a bar relative to the 60 FPS budget
+        budget_ms = 1000 / FPS
+        y = self.y + 24
+        for section in PROFILER_SECTIONS:
+            average = profiler.get_average(section)
+            peak = profiler.get_peak(section)
+            bar_width = min(60, int(60 * average / budget_ms))
+            color = RED if average > budget_ms * 0.5 else YELLOW if average > budget_ms * 0.2 else GREEN
+            pygame.draw.rect(screen, color, (self.x + self.width - 66, y + 3, max(1, bar_width), 8))
+            text = self.font.render(f"{section:13s} {average:6.2f} {peak:6.2f}", True, WHITE)
+            screen.blit(text, (self.x + 6, y))
+            y += self.line_height
+        
+        # Frame time histogram (newest on the right), line marks the frame budget
+        y += 8
+        bottom = y + self.histogram_height
+        if frame_times:
+            scale = self.histogram_height / max(budget_ms * 2, max(frame_times))
+            bar_width = max(1, (self.width - 12) // profiler.history)
+            x = self.x + self.width - 6 - bar_width * len(frame_times)
+            for frame_time in frame_times:
+                height = max(1, int(frame_time * scale))
+                color = RED if frame_time > budget_ms * 1.5 else GREEN
+                pygame.draw.rect(screen, color, (x, bottom - height, bar_width, height))
+                x += bar_width
+            budget_y = bottom - int(budget_ms * scale)
+            pygame.draw.line(screen, WHITE, (self.x + 6, budget_y), (self.x + self.width - 6, budget_y))
@@ -56,11 +56,9 @@ class Block:
         BLOCK_SIZE = self.block_size
         
         # Get sprite or use placeholder
-        sprite = self.asset_manager.get_sprite(f'block_{self.block_type}')
+        # Sprite scaled to block size (scaled copies are cached per size)
+        sprite = self.asset_manager.get_scaled_sprite(f'block_{self.block_type}', (BLOCK_SIZE, BLOCK_SIZE))
         if sprite:
-            # Scale sprite to block size if needed
-            if sprite.get_size() != (BLOCK_SIZE, BLOCK_SIZE):
-                sprite = pygame.transform.scale(sprite, (BLOCK_SIZE, BLOCK_SIZE))
             screen.blit(sprite, (screen_x, screen_y))
         else:
             # Enhanced block rendering with depth
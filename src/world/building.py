@@ -41,20 +41,24 @@ class Building:
     
     def render(self, screen, camera_x, camera_y):
         """Render building"""
+        self.render_body(screen, camera_x, camera_y)
+        self.render_label(screen, camera_x, camera_y)
+    
+    def render_body(self, screen, camera_x, camera_y):
+        """Render building sprite (or fallback shape) without the label"""
         screen_x = self.rect.x - camera_x
         screen_y = self.rect.y - camera_y
         
         # Try to load sprite first, fallback to colored rectangle
         sprite_name = f'building_{self.building_type}'
-        sprite = self.asset_manager.get_sprite(sprite_name)
+        
+        # ============================================
+        # ZMIANA SKALOWANIA OBRAZKÓW BUDYNKÓW - TUTAJ:
+        # ============================================
+        # Sprite scaled to building size (all buildings same size: TILE_SIZE * 9 = 288x288)
+        sprite = self.asset_manager.get_scaled_sprite(sprite_name, (self.width, self.height))
         
         if sprite:
-            # ============================================
-            # ZMIANA SKALOWANIA OBRAZKÓW BUDYNKÓW - TUTAJ:
-            # ============================================
-            # Scale sprite to building size (all buildings same size: TILE_SIZE * 9 = 288x288)
-            sprite = pygame.transform.scale(sprite, (self.width, self.height))
-            
             # ============================================
             # ZMIANA POZYCJI OBRAZKÓW BUDYNKÓW - TUTAJ:
             # ============================================
@@ -70,11 +74,8 @@ class Building:
             
             # Draw shadow
             shadow_offset = 4
-            shadow_rect = pygame.Rect(screen_x + shadow_offset, screen_y + self.height - shadow_offset, 
-                                     self.width, shadow_offset)
-            shadow_surface = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-            shadow_surface.fill((0, 0, 0, 150))
-            screen.blit(shadow_surface, shadow_rect)
+            shadow_surface = self.asset_manager.get_shadow(self.width, shadow_offset, 150)
+            screen.blit(shadow_surface, (screen_x + shadow_offset, screen_y + self.height - shadow_offset))
             
             # Main building body
             building_rect = pygame.Rect(screen_x, screen_y, self.width, self.height)
@@ -98,19 +99,27 @@ class Building:
             door_y = screen_y + self.height - door_height
             pygame.draw.rect(screen, dark_color, (door_x, door_y, door_width, door_height))
             pygame.draw.rect(screen, (20, 20, 20), (door_x, door_y, door_width, door_height), 2)
+    
+    def render_label(self, screen, camera_x, camera_y):
+        """Render building name label"""
+        screen_x = self.rect.x - camera_x
+        screen_y = self.rect.y - camera_y
         
-        # Draw label with background (always show label)
-        font = pygame.font.Font(None, 18)
-        text = font.render(self.building_type.upper(), True, WHITE)
+        # Draw label with background (always show label, text rendered once per building type)
+        text = self.asset_manager.get_variant(('building_label', self.building_type), self._render_label_text)
         text_rect = text.get_rect(center=(screen_x + self.width // 2, screen_y + self.height // 3))
         
-        # Text background
+        # Text background, then the text over it (blended onto the screen in that order,
+        # so the glyph edges match drawing them uncached)
         bg_rect = text_rect.inflate(8, 4)
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 180))
-        screen.blit(bg_surface, bg_rect)
+        screen.blit(self.asset_manager.get_shadow(bg_rect.width, bg_rect.height, 180), bg_rect)
         screen.blit(text, text_rect)
     
+    def _render_label_text(self):
+        """Render building name"""
+        font = pygame.font.Font(None, 18)
+        return font.render(self.building_type.upper(), True, WHITE)
+    
     def _get_building_color(self):
         """Get color based on building type"""
         colors = {
@@ -4,32 +4,65 @@ Dungeon generation and management
 """
 import random
 import pygame
+from concurrent.futures import ProcessPoolExecutor
 from src.config.settings import *
 from src.world.block import Block
 from src.entities.enemy import Enemy
+from src.systems.pathfinding import HierarchicalPathfinder
+from src.core.physics import CollisionDetector
 
-class Dungeon:
-    def __init__(self, width, height, asset_manager, difficulty=1):
+TILE_FLOOR = 0
+TILE_WALL = 1
+
+
+class DungeonLayout:
+    """
+    Dungeon generated on a compact tile array (one byte per tile).
+
+    Holds only plain data (tiles, rooms, enemy spawns), so layouts can be built
+    in worker processes and turned into blocks and enemies afterwards.
+    The same seed always gives the same layout.
+    """
+
+    def __init__(self, width, height, difficulty=1, seed=None):
         self.width = width
         self.height = height
-        self.asset_manager = asset_manager
         self.difficulty = difficulty
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
         
-        self.blocks = []
-        self.enemies = []
+        self.tiles = bytearray(width * height)
+        self.rooms = []
+        self.enemies = []  # (tile_x, tile_y, enemy_type)
         self.entrance = None
         self.exit = None
-        self.rooms = []
         
         self.generate()
+        # The generator isn't needed after generation (and keeps pickled layouts small)
+        self.rng = None
+    
+    def get_tile(self, x, y):
+        """Get tile type at position"""
+        return self.tiles[y * self.width + x]
+    
+    def set_tile(self, x, y, tile):
+        """Set tile type at position"""
+        self.tiles[y * self.width + x] = tile
+    
+    def get_wall_tiles(self):
+        """Get (x, y) of every wall tile"""
+        width = self.width
+        return [(index % width, index // width) for index, tile in enumerate(self.tiles) if tile == TILE_WALL]
     
     def generate(self):
-        """Generate dungeon layout"""
+        """Generate rooms, corridors and enemy spawns"""
         # Create floor and walls
         self._create_borders()
         
         # Generate rooms
-        num_rooms = random.randint(3 + self.difficulty, 6 + self.difficulty)
+        num_rooms = self.rng.randint(3 + self.difficulty, 6 + self.difficulty)
         for _ in range(num_rooms):
             self._create_room()
         
@@ -44,39 +77,32 @@ class Dungeon:
             self.entrance = self.rooms[0]['center']
             self.exit = self.rooms[-1]['center']
     
+    def _fill(self, x, y, width, height, tile):
+        """Set a rectangle of tiles"""
+        row = bytes([tile]) * width
+        for ty in range(y, y + height):
+            start = ty * self.width + x
+            self.tiles[start:start + width] = row
+    
     def _create_borders(self):
         """Create dungeon walls"""
         # Floor
-        for x in range(self.width):
-            for y in range(self.height - 5, self.height):
-                block = Block(x, y, 'stone', self.asset_manager, destructible=False)
-                self.blocks.append(block)
-        
+        self._fill(0, self.height - 5, self.width, 5, TILE_WALL)
         # Ceiling
-        for x in range(self.width):
-            for y in range(0, 2):
-                block = Block(x, y, 'stone', self.asset_manager, destructible=False)
-                self.blocks.append(block)
-        
+        self._fill(0, 0, self.width, 2, TILE_WALL)
         # Side walls
-        for y in range(self.height):
-            # Left wall
-            block = Block(0, y, 'stone', self.asset_manager, destructible=False)
-            self.blocks.append(block)
-            # Right wall
-            block = Block(self.width - 1, y, 'stone', self.asset_manager, destructible=False)
-            self.blocks.append(block)
+        self._fill(0, 0, 1, self.height, TILE_WALL)
+        self._fill(self.width - 1, 0, 1, self.height, TILE_WALL)
     
     def _create_room(self):
         """Create a random room"""
-        room_width = random.randint(4, 8)
-        room_height = random.randint(3, 6)
+        room_width = self.rng.randint(4, 8)
+        room_height = self.rng.randint(3, 6)
         
         # Random position (avoiding borders)
-        x = random.randint(2, self.width - room_width - 2)
-        y = random.randint(3, self.height - room_height - 7)
+        x = self.rng.randint(2, self.width - room_width - 2)
+        y = self.rng.randint(3, self.height - room_height - 7)
         
-        # Check if room overlaps with existing rooms
         new_room = {
             'x': x, 'y': y,
             'width': room_width,
@@ -90,19 +116,10 @@ class Dungeon:
                 return
         
         # Create room walls
-        for rx in range(x, x + room_width):
-            # Top and bottom walls
-            block_top = Block(rx, y, 'stone', self.asset_manager, destructible=False)
-            block_bottom = Block(rx, y + room_height - 1, 'stone', self.asset_manager, destructible=False)
-            self.blocks.append(block_top)
-            self.blocks.append(block_bottom)
-        
-        for ry in range(y, y + room_height):
-            # Left and right walls
-            block_left = Block(x, ry, 'stone', self.asset_manager, destructible=False)
-            block_right = Block(x + room_width - 1, ry, 'stone', self.asset_manager, destructible=False)
-            self.blocks.append(block_left)
-            self.blocks.append(block_right)
+        self._fill(x, y, room_width, 1, TILE_WALL)
+        self._fill(x, y + room_height - 1, room_width, 1, TILE_WALL)
+        self._fill(x, y, 1, room_height, TILE_WALL)
+        self._fill(x + room_width - 1, y, 1, room_height, TILE_WALL)
         
         self.rooms.append(new_room)
     
@@ -116,53 +133,143 @@ class Dungeon:
         )
     
     def _connect_rooms(self):
-        """Connect rooms with corridors"""
+        """Connect rooms with L-shaped corridors"""
         for i in range(len(self.rooms) - 1):
-            room1 = self.rooms[i]
-            room2 = self.rooms[i + 1]
-            
-            # Create L-shaped corridor
-            cx1, cy1 = room1['center']
-            cx2, cy2 = room2['center']
+            cx1, cy1 = self.rooms[i]['center']
+            cx2, cy2 = self.rooms[i + 1]['center']
             
-            # Horizontal corridor
-            if cx1 < cx2:
-                for x in range(cx1, cx2):
-                    self._clear_block(x, cy1)
-            else:
-                for x in range(cx2, cx1):
-                    self._clear_block(x, cy1)
-            
-            # Vertical corridor
-            if cy1 < cy2:
-                for y in range(cy1, cy2):
-                    self._clear_block(cx2, y)
-            else:
-                for y in range(cy2, cy1):
-                    self._clear_block(cx2, y)
-    
-    def _clear_block(self, x, y):
-        """Remove block at position"""
-        self.blocks = [b for b in self.blocks if not (b.grid_x == x and b.grid_y == y)]
+            # Horizontal corridor, then vertical
+            self._fill(min(cx1, cx2), cy1, abs(cx2 - cx1), 1, TILE_FLOOR)
+            self._fill(cx2, min(cy1, cy2), 1, abs(cy2 - cy1), TILE_FLOOR)
     
     def _spawn_enemies(self):
-        """Spawn enemies in rooms"""
+        """Pick enemy spawns in rooms"""
         enemy_types = list(ENEMY_TYPES.keys())
         
         # Skip first room (player spawn)
         for room in self.rooms[1:]:
             # Number of enemies based on difficulty
-            num_enemies = random.randint(1, 2 + self.difficulty)
+            num_enemies = self.rng.randint(1, 2 + self.difficulty)
             
             for _ in range(num_enemies):
                 # Random position in room
-                x = random.randint(room['x'] + 1, room['x'] + room['width'] - 2)
+                x = self.rng.randint(room['x'] + 1, room['x'] + room['width'] - 2)
                 y = room['y'] + room['height'] - 2
-                
-                # Random enemy type
-                enemy_type = random.choice(enemy_types)
-                enemy = Enemy(x * TILE_SIZE, y * TILE_SIZE, enemy_type, self.asset_manager)
-                self.enemies.append(enemy)
+                self.enemies.append((x, y, self.rng.choice(enemy_types)))
+
+
+def _generate_layout(args):
+    """Process pool worker: build one layout"""
+    return DungeonLayout(*args)
+
+
+def generate_many(seeds, width, height, difficulty=1, workers=None):
+    """Generate one layout per seed across a process pool (same order as seeds)"""
+    jobs = [(width, height, difficulty, seed) for seed in seeds]
+    if len(jobs) <= 1:
+        return [_generate_layout(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_generate_layout, jobs, chunksize=max(1, len(jobs) // 32)))
+
+
+class Dungeon:
+    def __init__(self, width, height, asset_manager, difficulty=1, seed=None, layout=None, rng=None):
+        self.width = width
+        self.height = height
+        self.asset_manager = asset_manager
+        self.difficulty = difficulty
+        # Without an explicit seed, draw one from the game's 'world' stream
+        if seed is None and rng is not None:
+            seed = rng.world.randrange(2 ** 32)
+        self.seed = seed
+        self.layout = layout  # Pre-generated DungeonLayout (e.g. from generate_many)
+        
+        self.blocks = []
+        self.enemies = []
+        self.entrance = None
+        self.exit = None
+        self.rooms = []
+        
+        # Tile index: (tile_x, tile_y) -> list of blocks covering that tile
+        self._tile_index = {}
+        self.navigator = HierarchicalPathfinder(self)
+        self.collision = CollisionDetector()
+        
+        self.generate()
+    
+    def generate(self):
+        """Generate dungeon layout"""
+        layout = self.layout or DungeonLayout(self.width, self.height, self.difficulty, self.seed)
+        self._build(layout)
+    
+    def _build(self, layout):
+        """Convert a generated layout into wall blocks and enemies"""
+        self.layout = layout
+        self.seed = layout.seed
+        self.rooms = layout.rooms
+        self.entrance = layout.entrance
+        self.exit = layout.exit
+        
+        self.blocks = [Block(x, y, 'stone', self.asset_manager, destructible=False)
+                       for x, y in layout.get_wall_tiles()]
+        self.enemies = [Enemy(x * TILE_SIZE, y * TILE_SIZE, enemy_type, self.asset_manager)
+                        for x, y, enemy_type in layout.enemies]
+        
+        # Index final layout for collision and navigation
+        self._index_blocks()
+    
+    def _index_blocks(self):
+        """Rebuild tile index from block list"""
+        self._tile_index = {}
+        for block in self.blocks:
+            self._tile_index.setdefault((block.grid_x, block.grid_y), []).append(block)
+        self.navigator.invalidate()
+    
+    def is_solid_tile(self, tile_x, tile_y):
+        """Check if a tile is occupied by any block"""
+        return (tile_x, tile_y) in self._tile_index
+    
+    def add_block(self, x, y, block_type):
+        """Add wall block to dungeon"""
+        block = Block(x, y, block_type, self.asset_manager, destructible=False)
+        self.blocks.append(block)
+        self._tile_index.setdefault((x, y), []).append(block)
+        self.navigator.invalidate()
+    
+    def remove_block(self, block):
+        """Remove block from dungeon"""
+        if block in self.blocks:
+            self.blocks.remove(block)
+            tile = (block.grid_x, block.grid_y)
+            tile_blocks = self._tile_index.get(tile)
+            if tile_blocks and block in tile_blocks:
+                tile_blocks.remove(block)
+                if not tile_blocks:
+                    del self._tile_index[tile]
+            self.navigator.invalidate()
+    
+    def get_colliding_blocks(self, rect):
+        """Get all blocks colliding with rect"""
+        colliding = []
+        for tile_x in range(rect.left // TILE_SIZE, (rect.right - 1) // TILE_SIZE + 1):
+            for tile_y in range(rect.top // TILE_SIZE, (rect.bottom - 1) // TILE_SIZE + 1):
+                for block in self._tile_index.get((tile_x, tile_y), ()):
+                    if block not in colliding and block.rect.colliderect(rect):
+                        colliding.append(block)
+        return colliding
+    
+    def sweep_rect(self, rect, dx, dy):
+        """Continuous collision: (time_of_impact, normal, block) for rect moving by (dx, dy)"""
+        return self.collision.sweep_aabb(rect, dx, dy, self)
+    
+    def update_enemies(self, dt, player):
+        """Update all dungeon enemies"""
+        for enemy in self.enemies[:]:
+            enemy.update(dt, player, self)
+            
+            # Remove dead enemies
+            if enemy.hp <= 0:
+                self.enemies.remove(enemy)
     
     def get_entrance_position(self):
         """Get dungeon entrance position"""
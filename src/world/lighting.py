@@ -0,0 +1,218 @@
+"""
+src/world/lighting.py
+Tile light map for the underground (sky and light source propagation)
+"""
+import pygame
+from collections import deque
+from src.config.settings import *
+
+
+class LightMap:
+    """
+    Per-tile light levels (0 = dark, max_level = full light).
+
+    Sky light falls straight down each column until the first solid tile, then
+    everything spreads by flood fill, losing one level per tile. Solid tiles are
+    lit by their neighbours (so block faces show) but don't pass light on.
+    Opening tiles can only brighten the map, so remove_block only relaxes
+    levels outward from the opened tiles; anything that darkens it (blocks
+    added, sources removed) marks the map dirty for a full rebuild.
+
+    Levels are mirrored into a one-pixel-per-tile texture that is scaled up
+    and blitted once per frame; only tiles whose level changed are rewritten.
+    """
+
+    def __init__(self, game_map, max_level=LIGHT_MAX_LEVEL):
+        self.game_map = game_map
+        self.width = game_map.width
+        self.height = game_map.height
+        self.max_level = max_level
+
+        self.levels = bytearray(self.width * self.height)
+        self.solid = bytearray(self.width * self.height)
+        self.sky_depth = [0] * self.width  # First solid row of each column
+        self.sources = {}  # tile index -> level
+        self.dirty = True
+
+        # Darkness alpha for each light level
+        self.alpha_table = bytes(
+            LIGHT_MAX_ALPHA * (max_level - min(level, max_level)) // max_level for level in range(256))
+        self.texture = None
+        self.changed = set()  # Tile indices not yet written to the texture
+        self.version = 0
+        self.scaled = None
+        self.scaled_key = None
+
+    def mark_dirty(self):
+        """Force a full rebuild before the next render (e.g. a block was added)"""
+        self.dirty = True
+
+    def add_light_source(self, tile_x, tile_y, level):
+        """Add a light source at a tile"""
+        if not (0 <= tile_x < self.width and 0 <= tile_y < self.height):
+            return
+        index = tile_y * self.width + tile_x
+        self.sources[index] = min(level, self.max_level)
+        if not self.dirty and self.levels[index] < self.sources[index]:
+            self.levels[index] = self.sources[index]
+            self.changed.add(index)
+            self._propagate(deque([index]))
+
+    def remove_light_source(self, tile_x, tile_y):
+        """Remove a light source (darkening needs a full rebuild)"""
+        if self.sources.pop(tile_y * self.width + tile_x, None) is not None:
+            self.mark_dirty()
+
+    def get_level(self, tile_x, tile_y):
+        """Get light level of a tile (tiles outside the map count as sky)"""
+        if not (0 <= tile_x < self.width and 0 <= tile_y < self.height):
+            return self.max_level
+        if self.dirty:
+            self.rebuild()
+        return self.levels[tile_y * self.width + tile_x]
+
+    def rebuild(self):
+        """Recompute every tile from the sky and light sources"""
+        self.dirty = False
+        width = self.width
+        is_solid_tile = self.game_map.is_solid_tile
+        for y in range(self.height):
+            row = y * width
+            for x in range(width):
+                self.solid[row + x] = 1 if is_solid_tile(x, y) else 0
+
+        self.levels = bytearray(width * self.height)
+        queue = deque()
+        for x in range(width):
+            y = self._fill_sky_column(x, 0, queue)
+            self.sky_depth[x] = y
+        for index, level in self.sources.items():
+            if self.levels[index] < level:
+                self.levels[index] = level
+                queue.append(index)
+        self._propagate(queue)
+
+        # Whole texture is rewritten from the new levels
+        self.texture = None
+        self.changed.clear()
+
+    def _fill_sky_column(self, x, y, queue):
+        """Light a column with full sky light from row y down to the first solid tile, returns that row"""
+        width = self.width
+        while y < self.height and not self.solid[y * width + x]:
+            index = y * width + x
+            if self.levels[index] != self.max_level:
+                self.levels[index] = self.max_level
+                self.changed.add(index)
+            queue.append(index)
+            y += 1
+        # The surface tile itself is fully lit
+        if y < self.height:
+            index = y * width + x
+            if self.levels[index] != self.max_level:
+                self.levels[index] = self.max_level
+                self.changed.add(index)
+        return y
+
+    def _propagate(self, queue):
+        """Spread light outward from queued tiles, only ever raising levels"""
+        width = self.width
+        height = self.height
+        levels = self.levels
+        solid = self.solid
+        sources = self.sources
+        changed = self.changed
+        while queue:
+            index = queue.popleft()
+            if solid[index] and index not in sources:
+                continue
+            level = levels[index] - 1
+            if level <= 0:
+                continue
+            x = index % width
+            if x > 0 and levels[index - 1] < level:
+                levels[index - 1] = level
+                changed.add(index - 1)
+                queue.append(index - 1)
+            if x < width - 1 and levels[index + 1] < level:
+                levels[index + 1] = level
+                changed.add(index + 1)
+                queue.append(index + 1)
+            if index >= width and levels[index - width] < level:
+                levels[index - width] = level
+                changed.add(index - width)
+                queue.append(index - width)
+            if index < (height - 1) * width and levels[index + width] < level:
+                levels[index + width] = level
+                changed.add(index + width)
+                queue.append(index + width)
+
+    def on_tiles_opened(self, tiles):
+        """Incrementally brighten the map after tiles became free (block removed)"""
+        if self.dirty or not tiles:
+            return
+
+        width = self.width
+        queue = deque()
+        # Top-down, so a column opened over several rows extends the sky in one go
+        for x, y in sorted(tiles, key=lambda tile: tile[1]):
+            if not (0 <= x < width and 0 <= y < self.height):
+                continue
+            index = y * width + x
+            self.solid[index] = 0
+            if y == self.sky_depth[x]:
+                self.sky_depth[x] = self._fill_sky_column(x, y, queue)
+            else:
+                queue.append(index)
+
+        # Lit neighbours now shine into the opened tiles
+        for x, y in tiles:
+            for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+                if 0 <= nx < width and 0 <= ny < self.height:
+                    queue.append(ny * width + nx)
+        self._propagate(queue)
+
+    def _sync_texture(self):
+        """Write changed levels into the light texture"""
+        if self.texture is None:
+            rgba = bytearray(self.width * self.height * 4)
+            rgba[3::4] = self.levels.translate(self.alpha_table)
+            self.texture = pygame.image.frombytes(bytes(rgba), (self.width, self.height), 'RGBA')
+            if pygame.display.get_surface():
+                # Match the display's pixel format so the per-frame blit takes the fast path
+                self.texture = self.texture.convert_alpha()
+            self.changed.clear()
+            self.version += 1
+        elif self.changed:
+            width = self.width
+            alpha_table = self.alpha_table
+            texture = self.texture
+            for index in self.changed:
+                texture.set_at((index % width, index // width), (0, 0, 0, alpha_table[self.levels[index]]))
+            self.changed.clear()
+            self.version += 1
+
+    def render(self, screen, camera_x, camera_y):
+        """Darken the visible tiles with one scaled blit of the light texture"""
+        if self.dirty:
+            self.rebuild()
+        self._sync_texture()
+
+        # The scaled region is snapped to a coarse grid so scrolling only
+        # rescales when the camera crosses a snap boundary
+        snap = LIGHT_TEXTURE_SNAP
+        screen_width, screen_height = screen.get_size()
+        start_x = int(camera_x) // TILE_SIZE // snap * snap
+        start_y = int(camera_y) // TILE_SIZE // snap * snap
+        area = pygame.Rect(start_x, start_y,
+                           screen_width // TILE_SIZE + snap + 2,
+                           screen_height // TILE_SIZE + snap + 2).clip(self.texture.get_rect())
+        if not area.width or not area.height:
+            return
+
+        key = (tuple(area), self.version)
+        if key != self.scaled_key:
+            self.scaled = pygame.transform.smoothscale(
+                self.texture.subsurface(area), (area.width * TILE_SIZE, area.height * TILE_SIZE))
+            self.scaled_key = key
+        screen.blit(self.scaled, (area.x * TILE_SIZE - camera_x, area.y * TILE_SIZE - camera_y))
@@ -6,24 +6,48 @@ import pygame
 from src.world.block import Block
 from src.world.building import Building
 from src.entities.enemy import Enemy
+from src.systems.pathfinding import FlowField
+from src.world.lighting import LightMap
+from src.world.spawn_index import SpawnIndex
+from src.core.physics import PhysicsEngine, CollisionDetector
+from src.core.events import EventBus, BlockDestroyed, EnemyKilled
 from src.config.settings import *
 
 class Map:
-    def __init__(self, width, height, asset_manager, map_type=None):
+    def __init__(self, width, height, asset_manager, map_type=None, events=None):
         self.width = width
         self.height = height
         self.asset_manager = asset_manager
         self.map_type = map_type  # Store map type for special rendering
+        self.events = events or EventBus()
+        
+        # The one-screen main map never changes, so its background, ground and
+        # buildings are baked into layers instead of being redrawn every frame
+        self.bakes_static_layers = map_type == MAP_MAIN
+        self.static_layers = {}  # (screen size, darkness bucket, camera_y) -> background + ground
+        self.building_layer = None
         
         # Grid of blocks
         self.blocks = []
+        # Tile index: (tile_x, tile_y) -> list of blocks covering that tile
+        self._tile_index = {}
         self.buildings = []
         self.enemies = []
+        self.enemy_counts = {}  # enemy_type -> living enemies of that type (kept by spawn/despawn)
         self.exits = []
         
         # Coins/items on ground
         self.items = []
         
+        # Shared flow field toward the player for chasing enemies
+        self.flow_field = FlowField(self)
+        # Cells where enemies can spawn (air above solid ground)
+        self.spawn_index = SpawnIndex(self)
+        # Underground light levels (only the deep exploration map is lit per tile)
+        self.light_map = LightMap(self) if map_type == MAP_EXPLORATION else None
+        self.physics = PhysicsEngine()
+        self.collision = CollisionDetector()
+        
         # Add invisible collision blocks at map edges
         self._add_edge_collisions()
     
@@ -36,51 +60,104 @@ class Map:
         for y in range(self.height):
             for wx in range(-wall_thickness, 0):
                 block = Block(wx, y, 'stone', self.asset_manager, destructible=False)
-                self.blocks.append(block)
+                self._insert_block(block)
         
         # Right wall (beyond map width)
         for y in range(self.height):
             for wx in range(self.width, self.width + wall_thickness):
                 block = Block(wx, y, 'stone', self.asset_manager, destructible=False)
-                self.blocks.append(block)
+                self._insert_block(block)
         
         # Top wall (negative y coordinates)
         for x in range(-wall_thickness, self.width + wall_thickness):
             for wy in range(-wall_thickness, 0):
                 block = Block(x, wy, 'stone', self.asset_manager, destructible=False)
-                self.blocks.append(block)
+                self._insert_block(block)
         
         # Bottom wall (beyond map height)
         for x in range(-wall_thickness, self.width + wall_thickness):
             for wy in range(self.height, self.height + wall_thickness):
                 block = Block(x, wy, 'stone', self.asset_manager, destructible=False)
-                self.blocks.append(block)
+                self._insert_block(block)
+    
+    def _block_tiles(self, block):
+        """Get all tiles covered by a block (destructible blocks cover 2x2 tiles)"""
+        span = block.block_size // TILE_SIZE
+        return [(block.grid_x + dx, block.grid_y + dy) for dx in range(span) for dy in range(span)]
+    
+    def _insert_block(self, block):
+        """Add block to block list and tile index"""
+        self.blocks.append(block)
+        for tile in self._block_tiles(block):
+            self._tile_index.setdefault(tile, []).append(block)
     
     def add_block(self, x, y, block_type, destructible=True):
         """Add block to map"""
         block = Block(x, y, block_type, self.asset_manager, destructible)
-        self.blocks.append(block)
+        self._insert_block(block)
+        self.flow_field.mark_dirty()
+        self.spawn_index.mark_dirty()
+        if self.light_map:
+            self.light_map.mark_dirty()
     
     def remove_block(self, block):
         """Remove block from map"""
         if block in self.blocks:
             self.blocks.remove(block)
+            opened_tiles = []
+            for tile in self._block_tiles(block):
+                tile_blocks = self._tile_index.get(tile)
+                if tile_blocks and block in tile_blocks:
+                    tile_blocks.remove(block)
+                    if not tile_blocks:
+                        del self._tile_index[tile]
+                        opened_tiles.append(tile)
+            self.flow_field.on_tiles_opened(opened_tiles)
+            self.spawn_index.on_tiles_opened(opened_tiles)
+            if self.light_map:
+                self.light_map.on_tiles_opened(opened_tiles)
+            self.events.publish(BlockDestroyed(self, block))
+    
+    def is_solid_tile(self, tile_x, tile_y):
+        """Check if a tile is occupied by any block"""
+        return (tile_x, tile_y) in self._tile_index
+    
+    def sweep_rect(self, rect, dx, dy):
+        """Continuous collision: (time_of_impact, normal, block) for rect moving by (dx, dy)"""
+        return self.collision.sweep_aabb(rect, dx, dy, self)
+    
+    def get_blocks_at_tile(self, tile_x, tile_y):
+        """Get blocks covering a tile (empty list if none)"""
+        return self._tile_index.get((tile_x, tile_y), [])
     
     def get_block_at(self, x, y):
         """Get block at world coordinates"""
-        for block in self.blocks:
+        for block in self._tile_index.get((int(x) // TILE_SIZE, int(y) // TILE_SIZE), []):
             if block.rect.collidepoint(x, y):
                 return block
         return None
     
     def get_colliding_blocks(self, rect):
         """Get all blocks colliding with rect"""
-        return [block for block in self.blocks if block.rect.colliderect(rect)]
+        # Only look at the tiles the rect overlaps instead of scanning every block
+        left = rect.left // TILE_SIZE
+        right = (rect.right - 1) // TILE_SIZE
+        top = rect.top // TILE_SIZE
+        bottom = (rect.bottom - 1) // TILE_SIZE
+        
+        colliding = []
+        for tile_x in range(left, right + 1):
+            for tile_y in range(top, bottom + 1):
+                for block in self._tile_index.get((tile_x, tile_y), ()):
+                    if block not in colliding and block.rect.colliderect(rect):
+                        colliding.append(block)
+        return colliding
     
     def add_building(self, x, y, building_type):
         """Add building to map"""
         building = Building(x, y, building_type, self.asset_manager)
         self.buildings.append(building)
+        self.building_layer = None
     
     def get_building_at(self, pos):
         """Get building at position"""
@@ -110,24 +187,68 @@ class Map:
         """
         enemy = Enemy(x * TILE_SIZE, y * TILE_SIZE, enemy_type, self.asset_manager, sprite_path)
         self.enemies.append(enemy)
+        self.enemy_counts[enemy_type] = self.enemy_counts.get(enemy_type, 0) + 1
+        return enemy
+    
+    def spawn_enemies(self, positions, enemy_type, sprite_path=None):
+        """Spawn several enemies of one type at grid positions, returns them"""
+        enemies = [Enemy(x * TILE_SIZE, y * TILE_SIZE, enemy_type, self.asset_manager, sprite_path)
+                   for x, y in positions]
+        if not enemies:
+            return enemies
+        self.enemies.extend(enemies)
+        self.enemy_counts[enemy_type] = self.enemy_counts.get(enemy_type, 0) + len(enemies)
+        return enemies
+    
+    def despawn_enemy(self, enemy, killed=False):
+        """Remove an enemy from the map (publishes EnemyKilled if killed)"""
+        if enemy in self.enemies:
+            self.enemies.remove(enemy)
+            self.enemy_counts[enemy.enemy_type] -= 1
+            if killed:
+                self.events.publish(EnemyKilled(self, enemy))
+    
+    def clear_enemies(self):
+        """Remove every enemy"""
+        self.enemies.clear()
+        self.enemy_counts.clear()
+    
+    def get_enemy_count(self, enemy_type):
+        """Get number of living enemies of a type"""
+        return self.enemy_counts.get(enemy_type, 0)
     
     def update_enemies(self, dt, player):
         """Update all enemies"""
+        # Refresh the shared flow field once per frame (cheap if player stayed on the same tile)
+        if self.enemies:
+            self.flow_field.update(player.rect)
+            self._update_enemy_sight(player)
+        
         for enemy in self.enemies[:]:
             enemy.update(dt, player, self)
             
             # Remove dead enemies
             if enemy.hp <= 0:
-                self.enemies.remove(enemy)
+                self.despawn_enemy(enemy, killed=True)
+    
+    def _update_enemy_sight(self, player):
+        """Batch line-of-sight checks for idle and patrolling enemies that could start chasing"""
+        watchers = [enemy for enemy in self.enemies
+                    if enemy.state in ('idle', 'patrol') and enemy.is_in_aggro_range(player)]
+        if not watchers:
+            return
+        
+        segments = [(enemy.rect.center, player.rect.center) for enemy in watchers]
+        for enemy, visible in zip(watchers, self.physics.line_of_sight_many(segments, self)):
+            enemy.can_see_player = visible
     
     def reset_exploration(self):
         """Reset exploration map (regenerate blocks and enemies)"""
         # This would regenerate the map
         pass
     
-    def render(self, screen, camera_x, camera_y, day_night_manager=None):
-        """Render entire map"""
-        # Calculate day/night darkness factor (0.0 = full day, 0.8 = max night)
+    def _get_darkness_factor(self, day_night_manager):
+        """Get day/night darkness factor (0.0 = full day, 0.8 = max night)"""
         # Maximum darkness is 0.8 to keep minimum 20% visibility (1.0 - 0.8 = 0.2)
         darkness_factor = 0.0
         if day_night_manager:
@@ -143,6 +264,10 @@ class Map:
                 # Dawn: transition from night to day
                 darkness_factor = 0.8 * (1 - (time_of_day - 0.25) / 0.25)
         
+        return darkness_factor
+    
+    def _render_background(self, screen, darkness_factor):
+        """Render background image (or gradient) darkened by day/night"""
         # Base colors (day)
         bg_color_top_day = (135, 206, 250)  # Light sky blue
         bg_color_mid_day = (176, 196, 222)  # Light steel blue
@@ -162,32 +287,28 @@ class Map:
         screen_width, screen_height = screen.get_size()
         
         # Use main base background for main map if available, otherwise use general background
-        if self.map_type == MAP_MAIN:
-            bg_sprite = self.asset_manager.get_sprite('background_main')
-            if not bg_sprite:
-                bg_sprite = self.asset_manager.get_sprite('background')
-        else:
-            bg_sprite = self.asset_manager.get_sprite('background')
+        bg_name = 'background'
+        if self.map_type == MAP_MAIN and self.asset_manager.has_sprite('background_main'):
+            bg_name = 'background_main'
+        
+        # Always scaled to full screen size to fill entire visible window
+        bg_sprite = self.asset_manager.get_scaled_sprite(bg_name, (screen_width, screen_height))
         
         if bg_sprite:
             # Use PNG background image
-            # Always scale to full screen size to fill entire visible window
-            bg_sprite = pygame.transform.scale(bg_sprite, (screen_width, screen_height))
             
             # Apply day/night darkness to background (only darken, keep minimum 20% visibility)
+            screen.blit(bg_sprite, (0, 0))
             if darkness_factor > 0:
-                # Create a darkened version by multiplying brightness
+                # Darken by multiplying brightness
                 # darkness_factor 0.8 means 20% brightness remains (80% darkness)
-                bg_sprite_copy = bg_sprite.copy()
-                # Use multiply blend to darken while preserving colors
-                dark_overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
                 # Calculate brightness multiplier: 1.0 = full brightness, 0.2 = 20% brightness (minimum)
                 brightness = 1.0 - darkness_factor  # This gives us 0.2 minimum (20% visibility)
-                dark_overlay.fill((int(255 * brightness), int(255 * brightness), int(255 * brightness), 255))
-                bg_sprite_copy.blit(dark_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-                screen.blit(bg_sprite_copy, (0, 0))
-            else:
-                screen.blit(bg_sprite, (0, 0))
+                value = int(255 * brightness)
+                dark_overlay = self.asset_manager.overlays.get_fill(
+                    'background_darken', (screen_width, screen_height), (value, value, value))
+                # Use multiply blend to darken while preserving colors
+                screen.blit(dark_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
         else:
             # Fallback to gradient background
             self._bg_surface = pygame.Surface((screen_width, screen_height))
@@ -207,46 +328,96 @@ class Map:
                     b = int(bg_color_mid[2] * (1 - local_ratio) + bg_color_bottom[2] * local_ratio)
                 pygame.draw.line(self._bg_surface, (r, g, b), (0, y), (screen_width, y))
             screen.blit(self._bg_surface, (0, 0))
+    
+    def _render_main_ground(self, screen, camera_y):
+        """Render the green ground block of the main map (from the top of ground to screen bottom)"""
+        # Get actual screen size
+        screen_width, screen_height = screen.get_size()
         
-        # Special rendering for main map: green ground block
-        if self.map_type == MAP_MAIN:
-            # Get actual screen size
-            screen_width, screen_height = screen.get_size()
-            
-            # Calculate ground position (where blocks start)
-            ground_y = 25 * TILE_SIZE  # Top of ground blocks
-            ground_screen_y = ground_y - camera_y
+        # Calculate ground position (where blocks start)
+        ground_y = 25 * TILE_SIZE  # Top of ground blocks
+        ground_screen_y = ground_y - camera_y
+        
+        # Draw green ground block from ground_y to bottom of screen, full width
+        # Always draw from top of screen if ground is above screen
+        green_start_y = max(0, ground_screen_y)
+        green_height = screen_height - green_start_y
+        
+        if green_height > 0:
+            # Green color with gradient for depth
+            green_base = (34, 139, 34)  # Forest green
+            green_dark = (0, 100, 0)     # Dark green
+            green_light = (50, 205, 50)  # Light green
             
-            # Draw green ground block from ground_y to bottom of screen, full width
-            # Always draw from top of screen if ground is above screen
-            green_start_y = max(0, ground_screen_y)
-            green_height = screen_height - green_start_y
+            # Draw gradient green block (dociągnięty do rogów i dołu)
+            for y_offset in range(green_height):
+                ratio = y_offset / max(green_height, 1)
+                # Gradient from light at top to dark at bottom
+                r = int(green_light[0] * (1 - ratio * 0.3) + green_base[0] * (ratio * 0.3))
+                g = int(green_light[1] * (1 - ratio * 0.3) + green_base[1] * (ratio * 0.3))
+                b = int(green_light[2] * (1 - ratio * 0.3) + green_base[2] * (ratio * 0.3))
+                pygame.draw.line(screen, (r, g, b), 
+                                (0, green_start_y + y_offset), 
+                                (screen_width, green_start_y + y_offset))
             
-            if green_height > 0:
-                # Green color with gradient for depth
-                green_base = (34, 139, 34)  # Forest green
-                green_dark = (0, 100, 0)     # Dark green
-                green_light = (50, 205, 50)  # Light green
-                
-                # Draw gradient green block (dociągnięty do rogów i dołu)
-                for y_offset in range(green_height):
-                    ratio = y_offset / max(green_height, 1)
-                    # Gradient from light at top to dark at bottom
-                    r = int(green_light[0] * (1 - ratio * 0.3) + green_base[0] * (ratio * 0.3))
-                    g = int(green_light[1] * (1 - ratio * 0.3) + green_base[1] * (ratio * 0.3))
-                    b = int(green_light[2] * (1 - ratio * 0.3) + green_base[2] * (ratio * 0.3))
-                    pygame.draw.line(screen, (r, g, b), 
-                                    (0, green_start_y + y_offset), 
-                                    (screen_width, green_start_y + y_offset))
+            # Add texture lines for grass effect at top
+            if ground_screen_y >= 0:
+                for i in range(0, screen_width, 20):
+                    pygame.draw.line(screen, green_dark, (i, ground_screen_y), (i, ground_screen_y + 5), 1)
                 
-                # Add texture lines for grass effect at top
-                if ground_screen_y >= 0:
-                    for i in range(0, screen_width, 20):
-                        pygame.draw.line(screen, green_dark, (i, ground_screen_y), (i, ground_screen_y + 5), 1)
-                    
-                    # Top border (grass line)
-                    pygame.draw.line(screen, green_light, (0, ground_screen_y), (screen_width, ground_screen_y), 3)
+                # Top border (grass line)
+                pygame.draw.line(screen, green_light, (0, ground_screen_y), (screen_width, ground_screen_y), 3)
+    
+    def _render_static_layers(self, screen, camera_x, camera_y, darkness_factor):
+        """Blit the baked background/ground layer"""
+        screen_size = screen.get_size()
+        
+        # Darkness is quantized so one bake covers a range of times of day
+        bucket = round(darkness_factor / 0.8 * STATIC_LAYER_DARKNESS_BUCKETS)
+        key = (screen_size, bucket, camera_y)
+        layer = self.static_layers.get(key)
+        if layer is None:
+            layer = pygame.Surface(screen_size)
+            self._render_background(layer, bucket * 0.8 / STATIC_LAYER_DARKNESS_BUCKETS)
+            self._render_main_ground(layer, camera_y)
+            # Keep only a few bakes (camera_y changes while jumping)
+            if len(self.static_layers) >= STATIC_LAYER_CACHE_SIZE:
+                del self.static_layers[next(iter(self.static_layers))]
+            self.static_layers[key] = layer
+        screen.blit(layer, (0, 0))
+    
+    def _render_building_layer(self, screen, camera_x, camera_y):
+        """Blit the visible part of the baked building layer, then the building labels"""
+        if self.building_layer is None:
+            self.building_layer = self._bake_building_layer()
+        screen.blit(self.building_layer, (0, 0), pygame.Rect(camera_x, camera_y, *screen.get_size()))
+        
+        # Labels are drawn straight onto the screen: their antialiased text
+        # blends differently over the transparent parts of the baked layer
+        for building in self.buildings:
+            building.render_label(screen, camera_x, camera_y)
+    
+    def _bake_building_layer(self):
+        """Render all building sprites onto a transparent world-sized surface"""
+        world_rect = pygame.Rect(0, 0, self.width * TILE_SIZE, self.height * TILE_SIZE)
+        for building in self.buildings:
+            world_rect.union_ip(building.rect)
+        layer = pygame.Surface(world_rect.size, pygame.SRCALPHA)
+        layer.fill((0, 0, 0, 0))
+        for building in self.buildings:
+            building.render_body(layer, 0, 0)
+        return layer
+    
+    def render(self, screen, camera_x, camera_y, day_night_manager=None):
+        """Render entire map"""
+        darkness_factor = self._get_darkness_factor(day_night_manager)
+        
+        if self.bakes_static_layers:
+            # Background and ground come from a baked layer
+            self._render_static_layers(screen, camera_x, camera_y, darkness_factor)
         else:
+            self._render_background(screen, darkness_factor)
+            
             # Render blocks normally for other maps
             for block in self.blocks:
                 block.render(screen, camera_x, camera_y)
@@ -260,10 +431,11 @@ class Map:
             screen_x = exit_point['rect'].x - camera_x
             screen_y = exit_point['rect'].y - camera_y
             
-            # Glow effect
-            glow_surface = pygame.Surface((exit_point['rect'].width + 8, exit_point['rect'].height + 8), pygame.SRCALPHA)
-            pygame.draw.rect(glow_surface, (255, 255, 0, 100), 
-                           (0, 0, exit_point['rect'].width + 8, exit_point['rect'].height + 8), 0)
+            # Glow effect (drawn once per exit size)
+            glow_size = (exit_point['rect'].width + 8, exit_point['rect'].height + 8)
+            glow_surface = self.asset_manager.overlays.get_shape(
+                'exit_glow', glow_size,
+                lambda surface: pygame.draw.rect(surface, (255, 255, 0, 100), surface.get_rect(), 0))
             screen.blit(glow_surface, (screen_x - 4, screen_y - 4))
             
             # Main exit indicator
@@ -280,5 +452,9 @@ class Map:
                 (center_x + 6, center_y)
             ])
         
+        if self.bakes_static_layers:
+            # Buildings are drawn over the exits
+            self._render_building_layer(screen, camera_x, camera_y)
+        
         # NOTE: Enemies are now rendered in game.py before player
         # to ensure player is rendered on top (first plan)
\ No newline at end of file
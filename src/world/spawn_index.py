@@ -0,0 +1,168 @@
+"""
+src/world/spawn_index.py
+Index of tiles where an enemy can spawn (air above solid ground)
+"""
+import math
+from bisect import bisect_right
+from src.config.settings import *
+
+
+class SpawnIndex:
+    """
+    Set of valid spawn cells, bucketed into square chunks.
+
+    A cell is the tile an enemy's feet stand in: it and the tile above must be
+    free (enemies are 2 tiles tall) and the tile below solid. That covers both
+    the surface of every column and the floors of dug-out cavities. Each chunk
+    keeps a list plus a position dict, so cells are added and removed in O(1)
+    and a random cell of a chunk is one list lookup.
+
+    Like the flow field, opening tiles is handled incrementally and adding
+    blocks marks the index dirty for a full rebuild.
+    """
+
+    def __init__(self, game_map, chunk_size=SPAWN_CHUNK_SIZE):
+        self.game_map = game_map
+        self.chunk_size = chunk_size
+        self.chunks = {}  # (chunk_x, chunk_y) -> [cell, ...]
+        self.positions = {}  # cell -> index in its chunk list
+        self.dirty = True
+
+    def __len__(self):
+        if self.dirty:
+            self.rebuild()
+        return len(self.positions)
+
+    def __contains__(self, cell):
+        if self.dirty:
+            self.rebuild()
+        return cell in self.positions
+
+    def mark_dirty(self):
+        """Force a full rebuild before the next query (e.g. a block was added)"""
+        self.dirty = True
+
+    def is_valid(self, cell):
+        """Check if an enemy can stand in a cell"""
+        x, y = cell
+        if not (0 <= x < self.game_map.width and 1 <= y < self.game_map.height - 1):
+            return False
+        is_solid_tile = self.game_map.is_solid_tile
+        return not is_solid_tile(x, y) and not is_solid_tile(x, y - 1) and is_solid_tile(x, y + 1)
+
+    def rebuild(self):
+        """Scan every column for valid cells"""
+        self.dirty = False
+        self.chunks = {}
+        self.positions = {}
+        is_solid_tile = self.game_map.is_solid_tile
+        for x in range(self.game_map.width):
+            # Walk down the column keeping the solidity of the two tiles above
+            above_free = False
+            free = not is_solid_tile(x, 0)
+            for y in range(1, self.game_map.height - 1):
+                below_free = not is_solid_tile(x, y + 1)
+                above_free, free = free, not is_solid_tile(x, y)
+                if free and above_free and not below_free:
+                    self._add((x, y))
+
+    def _add(self, cell):
+        """Add a cell to its chunk"""
+        if cell in self.positions:
+            return
+        chunk = self.chunks.setdefault((cell[0] // self.chunk_size, cell[1] // self.chunk_size), [])
+        self.positions[cell] = len(chunk)
+        chunk.append(cell)
+
+    def _remove(self, cell):
+        """Remove a cell from its chunk (swap with the chunk's last cell)"""
+        index = self.positions.pop(cell, None)
+        if index is None:
+            return
+        key = (cell[0] // self.chunk_size, cell[1] // self.chunk_size)
+        chunk = self.chunks[key]
+        last = chunk.pop()
+        if last != cell:
+            chunk[index] = last
+            self.positions[last] = index
+        if not chunk:
+            del self.chunks[key]
+
+    def on_tiles_opened(self, tiles):
+        """Update cells whose feet, head or ground tile became free"""
+        if self.dirty:
+            return
+        for x, y in tiles:
+            for cell in ((x, y - 1), (x, y), (x, y + 1)):
+                if self.is_valid(cell):
+                    self._add(cell)
+                else:
+                    self._remove(cell)
+
+    def sample(self, center, min_distance, max_distance, rng, min_row=None, max_row=None,
+               attempts=SPAWN_SAMPLE_ATTEMPTS):
+        """
+        Pick a random cell between min_distance and max_distance tiles from center
+        (and within [min_row, max_row] if given), or None if none was found.
+        """
+        cells = self.sample_many(center, min_distance, max_distance, rng, 1, min_row, max_row, attempts)
+        return cells[0] if cells else None
+    
+    def sample_many(self, center, min_distance, max_distance, rng, count, min_row=None, max_row=None,
+                    attempts=SPAWN_SAMPLE_ATTEMPTS):
+        """
+        Pick up to count distinct random cells in the annulus.
+        Chunks overlapping the annulus are weighted by their cell count; each
+        attempt is a constant-time pick, rejected if it falls outside or was
+        already picked. Gives up after count * attempts picks, so fewer cells
+        are returned when the annulus holds fewer than count.
+        """
+        if self.dirty:
+            self.rebuild()
+
+        size = self.chunk_size
+        cx, cy = center
+        first_row = cy - max_distance if min_row is None else max(cy - max_distance, min_row)
+        last_row = cy + max_distance if max_row is None else min(cy + max_distance, max_row)
+        if first_row > last_row:
+            return []
+
+        # Chunks that can hold a cell in range
+        cumulative = []
+        chunks = []
+        total = 0
+        for chunk_x in range((cx - max_distance) // size, (cx + max_distance) // size + 1):
+            for chunk_y in range(first_row // size, last_row // size + 1):
+                chunk = self.chunks.get((chunk_x, chunk_y))
+                if not chunk:
+                    continue
+                # Nearest and farthest chunk points from the center
+                near_x = max(chunk_x * size, min(cx, chunk_x * size + size - 1)) - cx
+                near_y = max(chunk_y * size, min(cy, chunk_y * size + size - 1)) - cy
+                far_x = max(abs(chunk_x * size - cx), abs(chunk_x * size + size - 1 - cx))
+                far_y = max(abs(chunk_y * size - cy), abs(chunk_y * size + size - 1 - cy))
+                if math.hypot(near_x, near_y) > max_distance or math.hypot(far_x, far_y) < min_distance:
+                    continue
+                total += len(chunk)
+                cumulative.append(total)
+                chunks.append(chunk)
+        if not chunks:
+            return []
+
+        min_squared = min_distance * min_distance
+        max_squared = max_distance * max_distance
+        count = min(count, total)
+        cells = []
+        chosen = set()
+        for _ in range(count * attempts):
+            if len(cells) >= count:
+                break
+            chunk = chunks[bisect_right(cumulative, rng.randrange(total))]
+            cell = chunk[rng.randrange(len(chunk))]
+            if cell in chosen or not first_row <= cell[1] <= last_row:
+                continue
+            distance_squared = (cell[0] - cx) ** 2 + (cell[1] - cy) ** 2
+            if min_squared <= distance_squared <= max_squared:
+                cells.append(cell)
+                chosen.add(cell)
+        return cells